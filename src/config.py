@@ -2,45 +2,134 @@
 Configuration management for Codex API
 """
 import os
+import functools
+import threading
+import time
+from dataclasses import dataclass
 from pathlib import Path
 from datetime import datetime
 
 
+@dataclass(frozen=True, slots=True)
+class _Env:
+    """Snapshot of environment-derived settings, read once per process"""
+    ai_provider: str
+    workspace_dir: Path
+    logs_dir: Path
+    projects_dir: Path
+    storage_dir: Path
+    timeout_seconds: int
+    host: str
+    port: int
+    log_level: str
+    openapi_enabled: bool
+    prompt_cache_enabled: bool
+
+
+@functools.lru_cache(maxsize=1)
+def env() -> _Env:
+    """Read environment variables once and return an immutable snapshot"""
+    workspace_dir = Path(os.getenv("WORKSPACE_DIR", "./data"))
+    return _Env(
+        ai_provider=os.getenv("AI_PROVIDER", "codex"),
+        workspace_dir=workspace_dir,
+        logs_dir=workspace_dir / "logs",
+        projects_dir=workspace_dir / "projects",
+        storage_dir=workspace_dir / "storage",
+        timeout_seconds=int(os.getenv("TIMEOUT_SECONDS", "60")),
+        host=os.getenv("HOST", "0.0.0.0"),
+        port=int(os.getenv("PORT", "8000")),
+        log_level=os.getenv("LOG_LEVEL", "INFO"),
+        openapi_enabled=os.getenv("OPENAPI_ENABLED", "true").lower() in ("1", "true", "yes"),
+        prompt_cache_enabled=os.getenv("PROMPT_CACHE_ENABLED", "false").lower() in ("1", "true", "yes"),
+    )
+
+
+# Directories already created by this process (skips repeated mkdir syscalls)
+_ensured_dirs: set[Path | str] = set()
+_ensured_dirs_lock = threading.Lock()
+
+
+def _ensure_dir(path: Path | str) -> Path | str:
+    """Create directory (and parents) once per process"""
+    if path not in _ensured_dirs:
+        os.makedirs(path, exist_ok=True)
+        with _ensured_dirs_lock:
+            _ensured_dirs.add(path)
+    return path
+
+
+def _forget_dir(path: Path | str) -> None:
+    """Drop a directory from the created-dirs cache (it was removed under us)"""
+    with _ensured_dirs_lock:
+        _ensured_dirs.discard(path)
+        _ensured_dirs.discard(str(path))
+
+
+# Projects found by project_exists: (projects_dir, project_id) -> expires_at.
+# Misses are not cached, so a newly created project is seen at once.
+_PROJECT_EXISTS_TTL = 5.0
+_PROJECT_EXISTS_MAX = 256
+_project_exists_cache: dict[tuple[str, str], float] = {}
+
+
+@functools.lru_cache(maxsize=8)
+def _log_folder_for(logs_dir: str, year: int, month: int, day: int) -> str:
+    """Return the logs/YYYY/MM/DD folder for a date (cached, rolls over daily)"""
+    return os.path.join(logs_dir, f"{year:04d}", f"{month:02d}", f"{day:02d}")
+
+
+def _filename_timestamp(dt: datetime) -> str:
+    """
+    Format timestamp for log filename (YYYYMMDD-HHMM-SSμμμμμμ).
+
+    Mirrors src.logging.timestamp.format_filename_timestamp; importing the
+    logging package from here would be circular (its writer imports config).
+    """
+    return (
+        f"{dt.year:04d}{dt.month:02d}{dt.day:02d}-"
+        f"{dt.hour:02d}{dt.minute:02d}-"
+        f"{dt.second:02d}{dt.microsecond:06d}"
+    )
+
+
 class Config:
     """Application configuration"""
     
     # AI Provider settings
-    AI_PROVIDER: str = os.getenv("AI_PROVIDER", "codex")
+    AI_PROVIDER: str = env().ai_provider
     
     # Workspace directory where AI can create/modify files
-    WORKSPACE_DIR: Path = Path(os.getenv("WORKSPACE_DIR", "./data"))
+    WORKSPACE_DIR: Path = env().workspace_dir
     
     # Logs directory for request/response logging
-    LOGS_DIR: Path = WORKSPACE_DIR / "logs"
+    LOGS_DIR: Path = env().logs_dir
     
     # Command timeout in seconds
-    TIMEOUT_SECONDS: int = int(os.getenv("TIMEOUT_SECONDS", "60"))
+    TIMEOUT_SECONDS: int = env().timeout_seconds
     
     # Server settings
-    HOST: str = os.getenv("HOST", "0.0.0.0")
-    PORT: int = int(os.getenv("PORT", "8000"))
+    HOST: str = env().host
+    PORT: int = env().port
     
     # Logging level
-    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
+    LOG_LEVEL: str = env().log_level
 
     # OpenAPI toggle
-    OPENAPI_ENABLED: bool = os.getenv("OPENAPI_ENABLED", "true").lower() in ("1", "true", "yes")
+    OPENAPI_ENABLED: bool = env().openapi_enabled
+
+    # Parsed-prompt cache (.prompts-cache.json in each prompts directory)
+    PROMPT_CACHE_ENABLED: bool = env().prompt_cache_enabled
     
     @classmethod
     def get_workspace_dir(cls) -> Path:
         """Get workspace directory, creating it if it doesn't exist"""
-        cls.WORKSPACE_DIR.mkdir(parents=True, exist_ok=True)
-        return cls.WORKSPACE_DIR
+        return _ensure_dir(cls.WORKSPACE_DIR)
     
 
     # Multi-project and multi-user support
-    PROJECTS_DIR: Path = WORKSPACE_DIR / "projects"
-    STORAGE_DIR: Path = WORKSPACE_DIR / "storage"
+    PROJECTS_DIR: Path = env().projects_dir
+    STORAGE_DIR: Path = env().storage_dir
 
     @classmethod
     def get_projects_dir(cls) -> Path:
@@ -70,20 +159,33 @@ class Config:
     @classmethod
     def list_available_projects(cls) -> list[str]:
         """List all available projects"""
-        if not cls.PROJECTS_DIR.exists():
+        try:
+            # DirEntry.is_dir() uses the file type from the listing, no per-child stat
+            with os.scandir(cls.PROJECTS_DIR) as it:
+                return sorted(e.name for e in it if e.is_dir())
+        except FileNotFoundError:
             return []
-        return sorted([d.name for d in cls.PROJECTS_DIR.iterdir() if d.is_dir()])
 
     @classmethod
     def project_exists(cls, project_id: str) -> bool:
-        """Check if project directory exists"""
-        return cls.get_project_dir(project_id).exists()
+        """Check if project directory exists (a found project is cached for a few seconds)"""
+        key = (str(cls.PROJECTS_DIR), project_id.lower())
+        now = time.monotonic()
+        expires_at = _project_exists_cache.get(key)
+        if expires_at is not None and expires_at > now:
+            return True
+        if not cls.get_project_dir(project_id).exists():
+            _project_exists_cache.pop(key, None)
+            return False
+        if len(_project_exists_cache) >= _PROJECT_EXISTS_MAX:
+            _project_exists_cache.clear()
+        _project_exists_cache[key] = now + _PROJECT_EXISTS_TTL
+        return True
 
     @classmethod
     def get_logs_dir(cls) -> Path:
         """Get logs directory, creating it if it doesn't exist"""
-        cls.LOGS_DIR.mkdir(parents=True, exist_ok=True)
-        return cls.LOGS_DIR
+        return _ensure_dir(cls.LOGS_DIR)
 
     @classmethod
     def get_log_file_path(cls, timestamp: datetime, status_code: int, file_request_id: str | None = None) -> Path:
@@ -98,16 +200,26 @@ class Config:
         Returns:
             Path: Full path to log file (logs/YYYY/MM/DD/{file_request_id}-{code}.md)
         """
-        from src.logging.timestamp import format_filename_timestamp, format_folder_path
-        
-        folder_path = cls.LOGS_DIR / format_folder_path(timestamp)
-        folder_path.mkdir(parents=True, exist_ok=True)
+        # Plain string paths here; a single Path is built for the return value
+        folder_path = _ensure_dir(
+            _log_folder_for(str(cls.LOGS_DIR), timestamp.year, timestamp.month, timestamp.day)
+        )
         
         if file_request_id:
             filename = f"{file_request_id}-{status_code}.md"
         else:
-            filename = f"{format_filename_timestamp(timestamp)}-{status_code}.md"
-        return folder_path / filename
+            filename = f"{_filename_timestamp(timestamp)}-{status_code}.md"
+        return Path(os.path.join(folder_path, filename))
+
+
+    @classmethod
+    def recreate_log_folder(cls, log_path: Path) -> None:
+        """
+        Recreate a log file's folder after it was deleted while running
+        (e.g. by `make clear-logs`), so the created-dirs cache stops trusting it.
+        """
+        _forget_dir(log_path.parent)
+        os.makedirs(log_path.parent, exist_ok=True)
 
 
 # Global config instance
@@ -9,9 +9,9 @@ from src.logging.timestamp import (
     format_numeric_timestamp,
     format_folder_path
 )
-from src.logging.formatter import format_log_markdown
+from src.logging.formatter import format_log_markdown, iter_log_markdown
 from src.logging.html_formatter import format_log_html
-from src.logging.writer import write_log
+from src.logging.writer import write_log, enqueue_log, flush_logs, log_write_failures, start_log_writer
 from src.logging.context import RequestLogContext
 
 __all__ = [
@@ -22,7 +22,12 @@ __all__ = [
     "format_numeric_timestamp",
     "format_folder_path",
     "format_log_markdown",
+    "iter_log_markdown",
     "format_log_html",
     "write_log",
+    "enqueue_log",
+    "flush_logs",
+    "log_write_failures",
+    "start_log_writer",
     "RequestLogContext",
 ]
@@ -3,18 +3,23 @@ Request logging context manager
 """
 import time
 from datetime import datetime
-from src.logging.models import LogEntry
+from typing import Any, Mapping
+from src.logging.models import LogEntry, MAX_LOGGED_BODY
 from src.logging.timestamp import generate_timestamp
 from src.providers.base import AIProviderResult
 
 
+# Logged header (lowercase) -> position in LogEntry.headers
+_LOGGED_HEADERS = {"x-project-id": 0, "x-user-id": 1, "x-dry": 2}
+
+
 class RequestLogContext:
     """
     Manages logging state throughout request lifecycle.
     Tracks all data needed for final log entry.
     """
     
-    def __init__(self, method: str, path: str, project_id: str, user_id: str, headers: dict, request_id: str | None = None, timestamp: datetime | None = None):
+    def __init__(self, method: str, path: str, project_id: str, user_id: str, headers: Mapping[str, str], request_id: str | None = None, timestamp: datetime | None = None):
         """
         Initialize logging context.
         
@@ -23,12 +28,12 @@ class RequestLogContext:
             path: Request path
             project_id: Project ID (resolved)
             user_id: User ID (resolved)
-            headers: Request headers dict
+            headers: Request headers mapping (kept by reference; only read in to_log_entry)
             request_id: Request ID (custom or generated)
             timestamp: Request timestamp (generated if not provided)
         """
         self.timestamp = timestamp if timestamp else generate_timestamp()
-        self.start_time = time.time()
+        self._start_ns = time.monotonic_ns()
         self.method = method
         self.path = path
         self.project_id = project_id
@@ -41,6 +46,9 @@ class RequestLogContext:
         self.command: str = "none"
         self.ai_output: str = ""
         self.response_body: str = ""
+        self.response_obj: Any | None = None
+        self.response_is_json: bool = False
+        self.response_full_len: int | None = None
         self.status_code: int = 500  # Default to error
         self.error_context: str | None = None
         self.cwd: str = ""
@@ -60,10 +68,43 @@ class RequestLogContext:
             output_parts.append(result.stderr)
         self.ai_output = "\n".join(output_parts).strip()
     
-    def set_response(self, body: str, status: int):
-        """Set response body and status code"""
-        self.response_body = body
+    def set_response(self, body: str, status: int, response_obj: Any | None = None):
+        """
+        Set response body and status code.
+        
+        Args:
+            body: Serialized response body
+            status: HTTP status code
+            response_obj: Already-parsed payload when the response is JSON,
+                so the log formatter does not need to parse body again
+        """
+        self.status_code = status
+        self.response_obj = response_obj
+        self.response_is_json = response_obj is not None
+        
+        # Only keep the logged prefix of large text bodies
+        if not self.response_is_json and len(body) > MAX_LOGGED_BODY:
+            self.response_full_len = len(body)
+            self.response_body = body[:MAX_LOGGED_BODY]
+        else:
+            self.response_full_len = None
+            self.response_body = body
+    
+    def set_json_response(self, payload: Any, status: int):
+        """
+        Set a JSON response without serializing it.
+        
+        The log formatter renders the payload itself, so no body string is kept.
+        
+        Args:
+            payload: JSON-serializable response payload
+            status: HTTP status code
+        """
         self.status_code = status
+        self.response_obj = payload
+        self.response_is_json = True
+        self.response_full_len = None
+        self.response_body = ""
     
     def set_error(self, context: str):
         """Set error context (e.g., 'timeout', 'execution_failed')"""
@@ -74,8 +115,8 @@ class RequestLogContext:
         self.cwd = cwd
     
     def get_duration_ms(self) -> int:
-        """Calculate duration in milliseconds"""
-        return int((time.time() - self.start_time) * 1000)
+        """Calculate duration in milliseconds (monotonic, immune to clock adjustments)"""
+        return (time.monotonic_ns() - self._start_ns) // 1_000_000
     
     def to_log_entry(self) -> LogEntry:
         """
@@ -84,13 +125,12 @@ class RequestLogContext:
         Returns:
             LogEntry: Complete log entry ready for formatting/writing
         """
-        # Filter headers to only X-Project-Id, X-User-Id, X-Dry
-        filtered_headers = {}
+        # Keep only X-Project-Id, X-User-Id, X-Dry (case-insensitive)
+        logged: list[str | None] = [None, None, None]
         for key, value in self.headers.items():
-            key_lower = key.lower()
-            if key_lower in ['x-project-id', 'x-user-id', 'x-dry']:
-                # Store with original key for display
-                filtered_headers[key] = value
+            index = _LOGGED_HEADERS.get(key.lower())
+            if index is not None:
+                logged[index] = value
         
         return LogEntry(
             request_id=self.request_id,
@@ -104,8 +144,11 @@ class RequestLogContext:
             duration_ms=self.get_duration_ms(),
             cwd=self.cwd,
             command=self.command,
-            headers=filtered_headers,
+            headers=tuple(logged),
             ai_output=self.ai_output,
             response_body=self.response_body,
-            error_context=self.error_context
+            error_context=self.error_context,
+            response_obj=self.response_obj,
+            response_is_json=self.response_is_json,
+            response_full_len=self.response_full_len
         )
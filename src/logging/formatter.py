@@ -1,8 +1,10 @@
 """
 Markdown log formatter
 """
+import io
 import json
-from src.logging.models import LogEntry
+from typing import Iterator
+from src.logging.models import LogEntry, MAX_LOGGED_BODY
 from src.logging.timestamp import format_title_timestamp, format_numeric_timestamp
 
 
@@ -17,29 +19,56 @@ def format_log_markdown(entry: LogEntry, is_dry_run: bool = False) -> str:
     Returns:
         str: Complete markdown document
     """
-    sections = [
-        f"# {format_title_timestamp(entry.timestamp)}",
-        "",
-        _format_metadata_table(entry),
-        "",
-        _format_command_section(entry.command),
-        "",
-        _format_headers_table(entry.headers),
-    ]
+    buf = io.StringIO()
+    for _ in _write_sections(buf, entry, is_dry_run):
+        pass
+    return buf.getvalue()
+
+
+def iter_log_markdown(entry: LogEntry, is_dry_run: bool = False) -> Iterator[str]:
+    """
+    Yield the markdown log document section by section.
+    
+    Joining the chunks produces the same document as format_log_markdown,
+    without requiring callers to hold the full string at once.
+    
+    Args:
+        entry: LogEntry to format
+        is_dry_run: If True, omit AI Output and Response sections
+        
+    Yields:
+        str: Consecutive chunks of the markdown document
+    """
+    buf = io.StringIO()
+    for _ in _write_sections(buf, entry, is_dry_run):
+        yield buf.getvalue()
+        buf.seek(0)
+        buf.truncate()
+
+
+def _write_sections(buf: io.StringIO, entry: LogEntry, is_dry_run: bool) -> Iterator[None]:
+    """Write document sections into buf, pausing after each one"""
+    buf.write(f"# {format_title_timestamp(entry.timestamp)}\n\n")
+    _format_metadata_table(buf, entry)
+    yield
+    buf.write("\n\n")
+    _format_command_section(buf, entry.command)
+    yield
+    buf.write("\n\n")
+    _format_headers_table(buf, entry.headers)
+    yield
     
     # Only include AI Output and Response sections if not dry-run
     if not is_dry_run:
-        sections.extend([
-            "",
-            _format_ai_output_section(entry.ai_output),
-            "",
-            _format_response_section(entry.response_body, entry.status_code),
-        ])
-    
-    return "\n".join(sections)
+        buf.write("\n\n")
+        _format_ai_output_section(buf, entry.ai_output)
+        yield
+        buf.write("\n\n")
+        _format_response_section(buf, entry)
+        yield
 
 
-def _format_metadata_table(entry: LogEntry) -> str:
+def _format_metadata_table(buf: io.StringIO, entry: LogEntry) -> None:
     """Format metadata table section with compact, aligned columns"""
     duration_str = f"{entry.duration_ms}ms"
     if entry.error_context:
@@ -49,64 +78,67 @@ def _format_metadata_table(entry: LogEntry) -> str:
     timestamp_numeric = format_numeric_timestamp(entry.timestamp)
     request_id_value = entry.request_id if entry.request_id else "none"
     
-    lines = [
-        "| Key        | Value                      |",
-        "|------------|----------------------------|",
-        f"| Request ID | {request_id_value:<26} |",
-        f"| Timestamp  | {timestamp_numeric:<26} |",
-        f"| Status     | {entry.status_code:<26} |",
-        f"| Method     | {entry.method:<26} |",
-        f"| Path       | {entry.path:<26} |",
-        f"| Project    | {entry.project_id:<26} |",
-        f"| User       | {entry.user_id:<26} |",
-        f"| Prompt     | {prompt_name:<26} |",
-        f"| CWD        | {entry.cwd:<26} |",
-        f"| Duration   | {duration_str:<26} |",
-    ]
-    return "\n".join(lines)
-
-
-def _format_command_section(command: str) -> str:
+    buf.write(
+        "| Key        | Value                      |\n"
+        "|------------|----------------------------|\n"
+        f"| Request ID | {request_id_value.ljust(26)} |\n"
+        f"| Timestamp  | {timestamp_numeric.ljust(26)} |\n"
+        f"| Status     | {str(entry.status_code).ljust(26)} |\n"
+        f"| Method     | {entry.method.ljust(26)} |\n"
+        f"| Path       | {entry.path.ljust(26)} |\n"
+        f"| Project    | {entry.project_id.ljust(26)} |\n"
+        f"| User       | {entry.user_id.ljust(26)} |\n"
+        f"| Prompt     | {prompt_name.ljust(26)} |\n"
+        f"| CWD        | {entry.cwd.ljust(26)} |\n"
+        f"| Duration   | {duration_str.ljust(26)} |"
+    )
+
+
+def _format_command_section(buf: io.StringIO, command: str) -> None:
     """Format command section"""
-    return f"## Command\n\n```bash\n{command}\n```"
+    buf.write(f"## Command\n\n```bash\n{command}\n```")
 
 
-def _format_headers_table(headers: dict[str, str]) -> str:
+def _format_headers_table(buf: io.StringIO, headers: tuple[str | None, str | None, str | None]) -> None:
     """Format headers table (only X-Project-Id, X-User-Id, X-Dry)"""
-    lines = [
-        "## Headers",
-        "",
-        "| Key           | Value                     |",
-        "|---------------|---------------------------|",
-    ]
-    
-    # Only include specific headers
-    for key in ["X-Project-Id", "X-User-Id", "X-Dry"]:
-        value = headers.get(key, headers.get(key.lower(), ""))
-        lines.append(f"| {key:<13} | {value:<25} |")
-    
-    return "\n".join(lines)
+    project, user, dry = headers
+    project = project or ""
+    user = user or ""
+    dry = dry or ""
+    buf.write(
+        "## Headers\n\n"
+        "| Key           | Value                     |\n"
+        "|---------------|---------------------------|\n"
+        f"| X-Project-Id  | {project.ljust(25)} |\n"
+        f"| X-User-Id     | {user.ljust(25)} |\n"
+        f"| X-Dry         | {dry.ljust(25)} |"
+    )
 
 
-def _format_ai_output_section(ai_output: str) -> str:
+def _format_ai_output_section(buf: io.StringIO, ai_output: str) -> None:
     """Format AI output section"""
     content = ai_output if ai_output else "No execution"
-    return f"## AI Output\n\n```text\n{content}\n```"
+    buf.write(f"## AI Output\n\n```text\n{content}\n```")
 
 
-def _format_response_section(response_body: str, status_code: int) -> str:
+def _format_response_section(buf: io.StringIO, entry: LogEntry) -> None:
     """Format response section"""
-    # Try to parse as JSON for pretty formatting
-    try:
-        parsed = json.loads(response_body)
-        formatted = json.dumps(parsed, indent=2)
-        return f"## Response\n\n```json\n{formatted}\n```"
-    except (json.JSONDecodeError, TypeError):
-        # Not JSON, treat as text
-        # Truncate if too long (> 10KB)
-        max_length = 10240
-        if len(response_body) > max_length:
-            truncated = response_body[:max_length]
-            return f"## Response\n\n```text\n{truncated}\n\n... (truncated, {len(response_body)} bytes total)\n```"
-        else:
-            return f"## Response\n\n```text\n{response_body}\n```"
+    # JSON responses are pretty-printed from the already-parsed payload
+    if entry.response_is_json:
+        formatted = json.dumps(entry.response_obj, indent=2)
+        buf.write(f"## Response\n\n```json\n{formatted}\n```")
+        return
+    
+    # Not JSON, treat as text
+    # Bodies are normally truncated by RequestLogContext; bound them here too
+    # for entries built elsewhere
+    response_body = entry.response_body
+    full_length = entry.response_full_len
+    if full_length is None and len(response_body) > MAX_LOGGED_BODY:
+        full_length = len(response_body)
+        response_body = response_body[:MAX_LOGGED_BODY]
+    
+    if full_length is not None:
+        buf.write(f"## Response\n\n```text\n{response_body}\n\n... (truncated, {full_length} bytes total)\n```")
+    else:
+        buf.write(f"## Response\n\n```text\n{response_body}\n```")
@@ -1,30 +1,25 @@
 """
 HTML formatter for dry-run log preview
 """
+import functools
+import threading
 import markdown
 
 
-def format_log_html(log_markdown: str) -> str:
-    """
-    Convert log markdown to HTML with proper rendering.
-    
-    Args:
-        log_markdown: Markdown content to render
-        
-    Returns:
-        str: Complete HTML document with rendered markdown
-    """
-    # Convert markdown to HTML
-    md = markdown.Markdown(extensions=['extra', 'codehilite', 'tables'])
-    html_content = md.convert(log_markdown)
-    
-    return f"""<!DOCTYPE html>
+# Extension loading is expensive, so one converter is built and reused.
+# Markdown instances are stateful, hence the lock around reset+convert.
+_MD = markdown.Markdown(extensions=['extra', 'codehilite', 'tables'])
+_MD_LOCK = threading.Lock()
+
+
+# Static document shell around the rendered markdown
+_HTML_PREFIX = """<!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
     <title>Dry-Run Log Preview</title>
     <style>
-        body {{
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Helvetica, Arial, sans-serif;
             max-width: 1200px;
             margin: 0 auto;
@@ -32,8 +27,8 @@ def format_log_html(log_markdown: str) -> str:
             background: #f6f8fa;
             line-height: 1.6;
             color: #24292e;
-        }}
-        h1 {{
+        }
+        h1 {
             color: #24292e;
             border-bottom: 1px solid #e1e4e8;
             padding-bottom: 0.3em;
@@ -41,8 +36,8 @@ def format_log_html(log_markdown: str) -> str:
             margin-bottom: 16px;
             font-size: 2em;
             font-weight: 600;
-        }}
-        h2 {{
+        }
+        h2 {
             color: #24292e;
             border-bottom: 1px solid #e1e4e8;
             padding-bottom: 0.3em;
@@ -50,8 +45,8 @@ def format_log_html(log_markdown: str) -> str:
             margin-bottom: 16px;
             font-size: 1.5em;
             font-weight: 600;
-        }}
-        table {{
+        }
+        table {
             border-collapse: collapse;
             border-spacing: 0;
             width: 100%;
@@ -59,20 +54,20 @@ def format_log_html(log_markdown: str) -> str:
             background: white;
             border: 1px solid #d0d7de;
             border-radius: 6px;
-        }}
-        th, td {{
+        }
+        th, td {
             padding: 6px 13px;
             border: 1px solid #d0d7de;
             text-align: left;
-        }}
-        th {{
+        }
+        th {
             background: #f6f8fa;
             font-weight: 600;
-        }}
-        tr:nth-child(even) {{
+        }
+        tr:nth-child(even) {
             background: #f6f8fa;
-        }}
-        pre {{
+        }
+        pre {
             background: #f6f8fa;
             border: 1px solid #d0d7de;
             border-radius: 6px;
@@ -81,28 +76,50 @@ def format_log_html(log_markdown: str) -> str:
             font-size: 85%;
             line-height: 1.45;
             margin: 16px 0;
-        }}
-        code {{
+        }
+        code {
             background: #f6f8fa;
             padding: 0.2em 0.4em;
             margin: 0;
             font-size: 85%;
             border-radius: 6px;
             font-family: 'Monaco', 'Menlo', 'Courier New', monospace;
-        }}
-        pre code {{
+        }
+        pre code {
             background: transparent;
             padding: 0;
             font-size: 100%;
             border-radius: 0;
-        }}
-        .codehilite {{
+        }
+        .codehilite {
             background: #f6f8fa;
             border-radius: 6px;
-        }}
+        }
     </style>
 </head>
 <body>
-{html_content}
+"""
+
+_HTML_SUFFIX = """
 </body>
 </html>"""
+
+
+@functools.lru_cache(maxsize=128)
+def format_log_html(log_markdown: str) -> str:
+    """
+    Convert log markdown to HTML with proper rendering.
+    
+    Args:
+        log_markdown: Markdown content to render
+        
+    Returns:
+        str: Complete HTML document with rendered markdown
+    
+    Rendering is deterministic, so repeat previews of the same markdown are cached.
+    """
+    # Convert markdown to HTML
+    with _MD_LOCK:
+        html_content = _MD.reset().convert(log_markdown)
+    
+    return f"{_HTML_PREFIX}{html_content}{_HTML_SUFFIX}"
@@ -3,9 +3,14 @@ Data models for logging system
 """
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Any
 
 
-@dataclass
+# Maximum number of characters of a text response body kept for logging
+MAX_LOGGED_BODY = 10240
+
+
+@dataclass(slots=True)
 class LogEntry:
     """Complete log entry data structure"""
     
@@ -19,8 +24,11 @@ class LogEntry:
     prompt_filename: str | None
     duration_ms: int
     command: str
-    headers: dict[str, str]
+    headers: tuple[str | None, str | None, str | None]  # (X-Project-Id, X-User-Id, X-Dry)
     ai_output: str
     response_body: str
     cwd: str = ""
     error_context: str | None = None
+    response_obj: Any | None = None  # parsed payload when the response is JSON
+    response_is_json: bool = False
+    response_full_len: int | None = None  # original length when response_body was truncated
@@ -46,9 +46,9 @@ def format_filename_timestamp(dt: datetime) -> str:
         str: Formatted timestamp for filename
     """
     return (
-        dt.strftime("%Y%m%d-%H%M-") +  # Date and time with separators
-        dt.strftime("%S") +             # Seconds
-        f"{dt.microsecond:06d}"         # Microseconds (6 digits)
+        f"{dt.year:04d}{dt.month:02d}{dt.day:02d}-"  # Date
+        f"{dt.hour:02d}{dt.minute:02d}-"             # Time
+        f"{dt.second:02d}{dt.microsecond:06d}"       # Seconds + microseconds
     )
 
 
@@ -65,7 +65,10 @@ def format_title_timestamp(dt: datetime) -> str:
     Returns:
         str: Formatted timestamp for display
     """
-    return dt.strftime("%Y/%m/%d %H:%M:%S") + f".{dt.microsecond:06d} UTC"
+    return (
+        f"{dt.year:04d}/{dt.month:02d}/{dt.day:02d} "
+        f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}.{dt.microsecond:06d} UTC"
+    )
 
 
 def format_numeric_timestamp(dt: datetime) -> str:
@@ -81,7 +84,10 @@ def format_numeric_timestamp(dt: datetime) -> str:
     Returns:
         str: Compact numeric timestamp
     """
-    return dt.strftime("%Y%m%d-%H%M%S") + f".{dt.microsecond:06d}"
+    return (
+        f"{dt.year:04d}{dt.month:02d}{dt.day:02d}-"
+        f"{dt.hour:02d}{dt.minute:02d}{dt.second:02d}.{dt.microsecond:06d}"
+    )
 
 
 def format_folder_path(dt: datetime) -> str:
@@ -97,4 +103,4 @@ def format_folder_path(dt: datetime) -> str:
     Returns:
         str: Formatted path for log directory
     """
-    return dt.strftime("%Y/%m/%d")
+    return f"{dt.year:04d}/{dt.month:02d}/{dt.day:02d}"
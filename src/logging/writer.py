@@ -1,12 +1,26 @@
 """
 Log file writer
 """
+import atexit
+import logging
+import queue
+import threading
 from pathlib import Path
 from src.logging.models import LogEntry
-from src.logging.formatter import format_log_markdown
+from src.logging.formatter import iter_log_markdown
 from src.config import config
 
 
+logger = logging.getLogger(__name__)
+
+# Pending (entry, file_request_id) pairs for the background writer
+_LOG_QUEUE: "queue.Queue[tuple[LogEntry, str | None]]" = queue.Queue(maxsize=4096)
+_writer_thread: threading.Thread | None = None
+_writer_lock = threading.Lock()
+# Entries the background writer failed to write (it logs them; requests never see them)
+_write_failures = 0
+
+
 def write_log(entry: LogEntry, file_request_id: str | None = None) -> Path:
     """
     Write log entry to disk.
@@ -22,10 +36,79 @@ def write_log(entry: LogEntry, file_request_id: str | None = None) -> Path:
         IOError: If log write fails
     """
     log_path = config.get_log_file_path(entry.timestamp, entry.status_code, file_request_id)
-    log_content = format_log_markdown(entry)
     
     try:
-        log_path.write_text(log_content, encoding='utf-8')
+        try:
+            f = log_path.open('wb', buffering=65536)
+        except FileNotFoundError:
+            # Folder deleted under a running server: recreate it and retry once
+            config.recreate_log_folder(log_path)
+            f = log_path.open('wb', buffering=65536)
+        # Stream sections straight to disk instead of building the whole document
+        with f as out:
+            for chunk in iter_log_markdown(entry):
+                out.write(chunk.encode('utf-8'))
         return log_path
     except Exception as e:
         raise IOError(f"Failed to write log file: {e}") from e
+
+
+def enqueue_log(entry: LogEntry, file_request_id: str | None = None) -> None:
+    """
+    Hand a log entry to the background writer thread.
+    
+    Formatting and disk I/O happen off the caller's thread. If the queue is
+    full the entry is written synchronously instead of being dropped.
+    
+    Args:
+        entry: LogEntry to write
+        file_request_id: Optional custom request ID for filename
+        
+    Raises:
+        IOError: If the synchronous fallback write fails
+    """
+    start_log_writer()
+    try:
+        _LOG_QUEUE.put_nowait((entry, file_request_id))
+    except queue.Full:
+        write_log(entry, file_request_id)
+
+
+def flush_logs() -> None:
+    """Block until every queued log entry has been written"""
+    _LOG_QUEUE.join()
+
+
+def log_write_failures() -> int:
+    """Number of queued log entries the background writer failed to write"""
+    return _write_failures
+
+
+def start_log_writer() -> None:
+    """Start the background writer thread (idempotent; also done on first enqueue)"""
+    global _writer_thread
+    if _writer_thread is not None:
+        return
+    with _writer_lock:
+        if _writer_thread is None:
+            thread = threading.Thread(target=_writer_loop, name="log-writer", daemon=True)
+            thread.start()
+            _writer_thread = thread
+
+
+def _writer_loop() -> None:
+    """Drain the log queue forever, writing one entry at a time"""
+    global _write_failures
+    while True:
+        entry, file_request_id = _LOG_QUEUE.get()
+        try:
+            write_log(entry, file_request_id)
+        except Exception as e:
+            _write_failures += 1
+            logger.error("Failed to write log: %s", e)
+        finally:
+            _LOG_QUEUE.task_done()
+
+
+# Don't lose queued entries when the process exits normally
+atexit.register(flush_logs)
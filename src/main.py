@@ -1,8 +1,14 @@
 import re
+import threading
+from pathlib import Path
 from fastapi import HTTPException, Request
 
 # Regex for validating project/user IDs
 PROJECT_USER_ID_PATTERN = re.compile(r'^[a-zA-Z0-9-]+$')
+_PROJECT_ID_MATCH = PROJECT_USER_ID_PATTERN.match  # bound once, used on every request
+
+# Deletes every character allowed in a lowercased ID; a valid ID translates to ""
+_STRIP_ID_CHARS = str.maketrans("", "", "abcdefghijklmnopqrstuvwxyz0123456789-")
 
 # Paths that should be ignored by the dynamic handler
 # These are standard browser/infrastructure requests that will never be prompts
@@ -19,6 +25,21 @@ IGNORED_PATHS = {
     "/.idea",                 # IDE config (prefix match)
 }
 
+# Exact or "<ignored>/..." prefix match against any IGNORED_PATHS entry, in one regex
+_IGNORED_MATCH = re.compile(
+    "^(?:" + "|".join(re.escape(p) for p in sorted(IGNORED_PATHS)) + ")(?:/|$)"
+).match
+
+# Accepted dry-run flag values (lowercased); "" means header present with no value
+_DRY_MAP = {"": True, "true": True, "1": True, "false": False, "0": False}
+
+# Static 404 detail for ignored paths (shared, never mutated); the exception
+# itself is raised fresh per request so concurrent raises don't share state
+_IGNORED_DETAIL = {
+    "error": "Not Found",
+    "message": "Resource not available"
+}
+
 def _parse_dry_flag(value: str | None) -> bool | None:
     """
     Parse dry-run flag from query/header value.
@@ -28,28 +49,20 @@ def _parse_dry_flag(value: str | None) -> bool | None:
     """
     if value is None:
         return None
-    if value == "":  # Header present with no value
-        return True
-    normalized = value.lower()
-    if normalized in ("true", "1"):
-        return True
-    if normalized in ("false", "0"):
-        return False
-    return None  # Invalid value treated as not set
+    return _DRY_MAP.get(value.lower())  # Invalid value treated as not set
 
-def extract_header(request: Request, name: str, default: str) -> str:
+def extract_header(headers: dict[str, str], name: str, default: str) -> str:
     """
     Extract header value with case-insensitive lookup, normalization, and validation.
+    
+    `headers` is a plain dict snapshot of the request headers (Starlette lowercases names).
     """
-    value = None
-    for header_name, header_value in request.headers.items():
-        if header_name.lower() == name.lower():
-            value = header_value
-            break
-    if value is None:
-        value = default
+    value = headers.get(name.lower(), default)
     normalized = value.lower()
-    if not PROJECT_USER_ID_PATTERN.match(normalized):
+    # Fast path: non-empty and only [a-z0-9-] after lowercasing; regex decides otherwise
+    if normalized and not normalized.translate(_STRIP_ID_CHARS):
+        return normalized
+    if not _PROJECT_ID_MATCH(normalized):
         raise HTTPException(
             status_code=400,
             detail={
@@ -65,7 +78,6 @@ def validate_project_exists(project_id: str):
     """
     Validate that project exists, raise 412 if not.
     """
-    from src.config import Config
     if not Config.project_exists(project_id):
         available = Config.list_available_projects()
         raise HTTPException(
@@ -78,6 +90,10 @@ def validate_project_exists(project_id: str):
             }
         )
 
+# (user_id, project_id) pairs whose workspace directories already exist
+_WORKSPACE_READY: set[tuple[str, str]] = set()
+_WORKSPACE_READY_LOCK = threading.Lock()
+
 def setup_user_workspace(user_id: str, project_id: str):
     """
     Setup user workspace directory.
@@ -86,15 +102,14 @@ def setup_user_workspace(user_id: str, project_id: str):
     No AGENTS.md symlinks are created; prompt composition reads AGENTS.md directly
     from the project directory when executing prompts.
     """
-    from src.config import Config
-    from pathlib import Path
-    import logging
-    
-    logger = logging.getLogger(__name__)
-    
     # Get paths
     workspace_path = Config.get_user_workspace_dir(user_id, project_id)
     
+    # Directories are created once per process; skip the mkdirs on repeat hits
+    key = (user_id, project_id)
+    if key in _WORKSPACE_READY:
+        return workspace_path
+    
     # Create user directory if needed
     user_dir = Config.get_storage_dir() / user_id
     user_dir.mkdir(parents=True, exist_ok=True)
@@ -104,30 +119,38 @@ def setup_user_workspace(user_id: str, project_id: str):
     workspace_path.mkdir(parents=True, exist_ok=True)
     logger.debug(f"Ensured workspace exists: {workspace_path}")
     
+    with _WORKSPACE_READY_LOCK:
+        _WORKSPACE_READY.add(key)
     return workspace_path
 
 """
 Codex API Server - Phase 3
 FastAPI server with dynamic prompt-based routing
 """
+import asyncio
+import functools
 import logging
 import json
+from contextlib import asynccontextmanager
+from typing import Any
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.responses import PlainTextResponse, JSONResponse, HTMLResponse, Response
-from src.config import config
+from src.config import Config, config
 from src.providers.factory import ProviderFactory, ProviderNotFoundError
 from src.prompts.router import DynamicRouter
+from src.prompts.loader import prompts_fingerprint
 from src.prompts.executor import PromptExecutor
 from src.prompts.body_validator import (
     parse_body_schema,
     validate_body_schema,
     build_pydantic_model,
     validate_request_body,
+    validate_request_body_json,
     PromptConfigurationError,
 )
-from src.openapi.generator import generate_openapi
+from src.openapi.generator import generate_openapi_bytes
 from src.logging.context import RequestLogContext
-from src.logging.writer import write_log
+from src.logging.writer import enqueue_log, flush_logs, log_write_failures, start_log_writer
 from src.logging.formatter import format_log_markdown
 from src.logging.html_formatter import format_log_html
 from src.logging.timestamp import generate_request_id, generate_timestamp
@@ -141,10 +164,63 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Loaded routers per prompts directory: path -> (fingerprint, router)
+_ROUTER_CACHE: dict[str, tuple[tuple, DynamicRouter]] = {}
+
+
+def get_router(prompts_dir: Path) -> DynamicRouter:
+    """
+    Return a loaded router for a prompts directory, reusing it until prompts change.
+    """
+    fingerprint = prompts_fingerprint(prompts_dir)
+    key = str(prompts_dir)
+    cached = _ROUTER_CACHE.get(key)
+    if fingerprint is not None and cached is not None and cached[0] == fingerprint:
+        return cached[1]
+    
+    router = DynamicRouter(prompts_dir)
+    router.load_prompts()
+    if fingerprint is not None:
+        _ROUTER_CACHE[key] = (fingerprint, router)
+    return router
+
+
+def _parse_json_output(text: str) -> Any | None:
+    """AI output parsed as JSON (for pretty-printed, untruncated logging), or None"""
+    try:
+        return json.loads(text)
+    except ValueError:
+        return None
+
+
+def _fail(log_ctx: RequestLogContext, status: int, detail: dict, file_request_id: str, display_request_id: str):
+    """
+    Record an error response in the request log and raise it as an HTTPException.
+    
+    Log write failures are reported but never mask the original error.
+    """
+    log_ctx.set_json_response(detail, status)
+    try:
+        enqueue_log(log_ctx.to_log_entry(), file_request_id)
+    except IOError as log_err:
+        logger.error(f"Failed to write log: {log_err}")
+    raise HTTPException(status_code=status, detail=detail, headers={"x-request-id": display_request_id})
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run the background log writer for the lifetime of the server"""
+    start_log_writer()
+    yield
+    # Drain queued request logs before the process exits
+    await asyncio.get_running_loop().run_in_executor(None, flush_logs)
+
+
 # Disable FastAPI's built-in /openapi.json and /docs to use our custom generator
 app = FastAPI(
     title="Codex API", 
     version="0.3.0",
+    lifespan=lifespan,
     docs_url=None,  # Disable built-in /docs
     redoc_url=None,  # Disable built-in /redoc
     openapi_url=None  # Disable built-in /openapi.json
@@ -165,17 +241,20 @@ async def root():
         },
         "provider": config.AI_PROVIDER,
         "available_providers": ProviderFactory.list_providers(),
-        "projects_dir": str(config.get_projects_dir())
+        "projects_dir": str(config.get_projects_dir()),
+        "log_write_failures": log_write_failures()
     }
 
 
-@app.get("/openapi.json")
-async def openapi_document(request: Request, project: str = "default"):
+def _resolve_openapi_project(project: str) -> str:
     """
-    Dynamically generate OpenAPI 3.1 document from project's prompt files.
+    Validate the ?project= parameter shared by the OpenAPI endpoints.
     
-    Query Parameters:
-        project: Project ID (default: "default")
+    Returns:
+        Normalized project ID
+        
+    Raises:
+        HTTPException: 404 if OpenAPI is disabled or the project is unknown, 400 if the ID is malformed
     """
     if not config.OPENAPI_ENABLED:
         raise HTTPException(status_code=404, detail={
@@ -187,7 +266,7 @@ async def openapi_document(request: Request, project: str = "default"):
     project_id = project.lower()
     
     # Validate format
-    if not PROJECT_USER_ID_PATTERN.match(project_id):
+    if not _PROJECT_ID_MATCH(project_id):
         raise HTTPException(
             status_code=400,
             detail={
@@ -209,74 +288,66 @@ async def openapi_document(request: Request, project: str = "default"):
             }
         )
     
+    return project_id
+
+
+@app.get("/openapi.json")
+async def openapi_document(request: Request, project: str = "default"):
+    """
+    Dynamically generate OpenAPI 3.1 document from project's prompt files.
+    
+    Query Parameters:
+        project: Project ID (default: "default")
+    """
+    project_id = _resolve_openapi_project(project)
+    
     # Get project's prompts directory
     prompts_dir = config.get_project_prompts_dir(project_id)
-    result = generate_openapi(prompts_dir)
-    if "errors" in result:
-        return JSONResponse(status_code=500, content=result)
-    return JSONResponse(content=result)
+    result, body = generate_openapi_bytes(prompts_dir)
+    status_code = 500 if "errors" in result else 200
+    return Response(content=body, status_code=status_code, media_type="application/json")
 
 
-@app.get("/openapi")
-async def openapi_swagger_ui(project: str = "default"):
-        """Serve Swagger UI that consumes the dynamic /openapi.json."""
-        if not config.OPENAPI_ENABLED:
-                raise HTTPException(status_code=404, detail={
-                        "error": "Not Found",
-                        "message": "OpenAPI endpoint is disabled",
-                })
-        
-        # Normalize and validate project parameter
-        project_id = project.lower()
-        
-        # Validate format
-        if not PROJECT_USER_ID_PATTERN.match(project_id):
-            raise HTTPException(
-                status_code=400,
-                detail={
-                    "error": "Bad Request",
-                    "message": f"Invalid project ID: must match [a-zA-Z0-9-]+",
-                    "received": project,
-                }
-            )
-        
-        # Check project exists
-        if not config.project_exists(project_id):
-            raise HTTPException(
-                status_code=404,
-                detail={
-                    "error": "Not Found",
-                    "message": f"Project '{project_id}' does not exist",
-                    "requested_project": project_id,
-                    "available_projects": config.list_available_projects()
-                }
-            )
-        
-        html = f"""
+# Swagger UI page; __PROJECT_ID__ is filled in per project
+_SWAGGER_TEMPLATE = """
         <!DOCTYPE html>
         <html lang="en">
         <head>
             <meta charset="UTF-8">
-            <title>Codex API – Swagger UI (Project: {project_id})</title>
+            <title>Codex API – Swagger UI (Project: __PROJECT_ID__)</title>
             <link rel="stylesheet" href="https://unpkg.com/swagger-ui-dist@5/swagger-ui.css" />
         </head>
         <body>
             <div id="swagger-ui"></div>
             <script src="https://unpkg.com/swagger-ui-dist@5/swagger-ui-bundle.js"></script>
             <script>
-                window.onload = () => {{
-                    const ui = SwaggerUIBundle({{
-                        url: '/openapi.json?project={project_id}',
+                window.onload = () => {
+                    const ui = SwaggerUIBundle({
+                        url: '/openapi.json?project=__PROJECT_ID__',
                         dom_id: '#swagger-ui',
                         presets: [SwaggerUIBundle.presets.apis],
                         layout: 'BaseLayout'
-                    }});
+                    });
                     window.ui = ui;
-                }};
+                };
             </script>
         </body>
         </html>
         """
+
+
+@functools.lru_cache(maxsize=64)
+def _swagger_html(project_id: str) -> str:
+    """Render the Swagger UI page for a project (cached)"""
+    return _SWAGGER_TEMPLATE.replace("__PROJECT_ID__", project_id)
+
+
+@app.get("/openapi")
+async def openapi_swagger_ui(project: str = "default"):
+        """Serve Swagger UI that consumes the dynamic /openapi.json."""
+        project_id = _resolve_openapi_project(project)
+        
+        html = _swagger_html(project_id)
         return HTMLResponse(content=html)
 
 
@@ -291,20 +362,9 @@ async def dynamic_prompt_handler(request: Request, path: str):
     # Check if path should be ignored (standard browser/infrastructure requests)
     full_path = f"/{path}" if path else "/"
     
-    # Check exact matches first
-    if full_path in IGNORED_PATHS:
-        raise HTTPException(status_code=404, detail={
-            "error": "Not Found",
-            "message": f"Resource not available"
-        })
-    
-    # Check prefix matches (for paths like .well-known/*, .git/*, etc.)
-    for ignored in IGNORED_PATHS:
-        if full_path.startswith(ignored + "/") or full_path == ignored:
-            raise HTTPException(status_code=404, detail={
-                "error": "Not Found",
-                "message": f"Resource not available"
-            })
+    # Exact and prefix matches (for paths like .well-known/*, .git/*, etc.)
+    if _IGNORED_MATCH(full_path):
+        raise HTTPException(status_code=404, detail=_IGNORED_DETAIL)
     
     # Initialize logging context early
     method = request.method
@@ -314,7 +374,9 @@ async def dynamic_prompt_handler(request: Request, path: str):
     
     # Extract or generate request ID
     # Client can provide custom request_id, but filename will still use generated timestamp
-    custom_request_id = request.headers.get('x-request-id')
+    # Snapshot headers once; Starlette keys are already lowercase
+    req_headers = dict(request.headers)
+    custom_request_id = req_headers.get('x-request-id')
     file_request_id = generate_request_id(request_timestamp)  # Use same timestamp
     display_request_id = custom_request_id if custom_request_id else file_request_id
     
@@ -323,15 +385,15 @@ async def dynamic_prompt_handler(request: Request, path: str):
         path=full_path,
         project_id="default",  # Will be updated
         user_id="anonymous",   # Will be updated
-        headers=dict(request.headers),
+        headers=req_headers,
         request_id=display_request_id,
         timestamp=request_timestamp
     )
     
     try:
         # Extract and validate headers
-        project_id = extract_header(request, "x-project-id", "default")
-        user_id = extract_header(request, "x-user-id", "anonymous")
+        project_id = extract_header(req_headers, "x-project-id", "default")
+        user_id = extract_header(req_headers, "x-user-id", "anonymous")
         
         # Update logging context with resolved IDs
         log_ctx.project_id = project_id
@@ -341,7 +403,7 @@ async def dynamic_prompt_handler(request: Request, path: str):
         dry_from_query = request.query_params.get('dry')
         dry_query = _parse_dry_flag(dry_from_query)
         
-        dry_from_header = request.headers.get('x-dry')
+        dry_from_header = req_headers.get('x-dry')
         dry_header = _parse_dry_flag(dry_from_header)
         
         logger.info(f"Dynamic route request: {method} {full_path} (project={project_id}, user={user_id})")
@@ -352,9 +414,8 @@ async def dynamic_prompt_handler(request: Request, path: str):
         # Get project's prompts directory
         prompts_dir = config.get_project_prompts_dir(project_id)
         
-        # Initialize router and load prompts
-        router = DynamicRouter(prompts_dir)
-        router.load_prompts()
+        # Get router (prompts are reloaded only when the directory changes)
+        router = get_router(prompts_dir)
         
         # Match route
         match = router.match_route(method, full_path)
@@ -366,13 +427,7 @@ async def dynamic_prompt_handler(request: Request, path: str):
                 "message": f"No prompt found for route: {method} {full_path}",
                 "available_prompts": len(router.prompts)
             }
-            log_ctx.set_response(json.dumps(error_detail), 404)
-            # Write log before raising exception
-            try:
-                write_log(log_ctx.to_log_entry(), file_request_id)
-            except IOError as log_err:
-                logger.error(f"Failed to write log: {log_err}")
-            raise HTTPException(status_code=404, detail=error_detail, headers={"x-request-id": display_request_id})
+            _fail(log_ctx, 404, error_detail, file_request_id, display_request_id)
         
         logger.info(f"Matched prompt: {match.prompt.filename} (type={match.match_type}, params={match.path_params})")
         log_ctx.set_prompt(match.prompt.filename)
@@ -388,15 +443,7 @@ async def dynamic_prompt_handler(request: Request, path: str):
             logger.info(f"Dry-run mode enabled for {match.prompt.filename}")
             
             # DRY-RUN MODE: Return HTML preview instead of executing
-            # Build mock command
-            provider_name = match.prompt.agent if match.prompt.agent else config.AI_PROVIDER
-            provider = ProviderFactory.create(
-                provider_name=provider_name,
-                workspace_dir=config.get_workspace_dir(),
-                timeout=config.TIMEOUT_SECONDS
-            )
-            
-            # Execute in dry-run mode to get command
+            # Execute in dry-run mode to get command (the executor resolves the provider)
             workspace_dir = setup_user_workspace(user_id, project_id)
             executor = PromptExecutor(workspace_dir=workspace_dir, timeout=config.TIMEOUT_SECONDS)
             # Record cwd for log metadata
@@ -417,7 +464,7 @@ async def dynamic_prompt_handler(request: Request, path: str):
             log_markdown = format_log_markdown(log_entry, is_dry_run=True)
             
             # Detect client type from Accept header
-            accept_header = request.headers.get("accept", "")
+            accept_header = req_headers.get("accept", "")
             prefers_html = "text/html" in accept_header or "application/xhtml" in accept_header
             
             # Browsers send Accept: text/html, curl/postman send */* or text/plain
@@ -448,7 +495,7 @@ async def dynamic_prompt_handler(request: Request, path: str):
                 route_param_names = list(match.path_params.keys()) if match.path_params else []
                 validate_body_schema(field_schemas, route_param_names, method)
                 
-                # Build Pydantic model
+                # Build Pydantic model (cached per schema signature)
                 pydantic_model = build_pydantic_model(field_schemas)
                 
             except PromptConfigurationError as e:
@@ -459,15 +506,10 @@ async def dynamic_prompt_handler(request: Request, path: str):
                     "message": str(e),
                     "resolution": "Fix the prompt file configuration"
                 }
-                log_ctx.set_response(json.dumps(error_detail), 500)
-                try:
-                    write_log(log_ctx.to_log_entry(), file_request_id)
-                except IOError as log_err:
-                    logger.error(f"Failed to write log: {log_err}")
-                raise HTTPException(status_code=500, detail=error_detail, headers={"x-request-id": display_request_id})
+                _fail(log_ctx, 500, error_detail, file_request_id, display_request_id)
             
             # Validate Content-Type
-            content_type = request.headers.get('content-type', '')
+            content_type = req_headers.get('content-type', '')
             if not content_type.startswith('application/json'):
                 error_detail = {
                     "error": "Unsupported Media Type",
@@ -475,34 +517,25 @@ async def dynamic_prompt_handler(request: Request, path: str):
                     "received": content_type or "none",
                     "expected": "application/json"
                 }
-                log_ctx.set_response(json.dumps(error_detail), 415)
-                try:
-                    write_log(log_ctx.to_log_entry(), file_request_id)
-                except IOError as log_err:
-                    logger.error(f"Failed to write log: {log_err}")
-                raise HTTPException(status_code=415, detail=error_detail, headers={"x-request-id": display_request_id})
+                _fail(log_ctx, 415, error_detail, file_request_id, display_request_id)
             
-            # Parse request body
+            # Parse request body (an explicit Content-Length of 0 needs no read)
             try:
-                raw_body = await request.body()
+                if req_headers.get('content-length') == '0':
+                    raw_body = b""
+                else:
+                    raw_body = await request.body()
+                # Validate request body (JSON is parsed and validated in one pass)
                 if not raw_body:
-                    request_body = {}
+                    validated_data, validation_errors = validate_request_body({}, pydantic_model)
                 else:
-                    request_body = json.loads(raw_body)
+                    validated_data, validation_errors = validate_request_body_json(raw_body, pydantic_model)
             except json.JSONDecodeError as e:
                 error_detail = {
                     "error": "Bad Request",
                     "message": f"Invalid JSON in request body: {str(e)}",
                 }
-                log_ctx.set_response(json.dumps(error_detail), 400)
-                try:
-                    write_log(log_ctx.to_log_entry(), file_request_id)
-                except IOError as log_err:
-                    logger.error(f"Failed to write log: {log_err}")
-                raise HTTPException(status_code=400, detail=error_detail, headers={"x-request-id": display_request_id})
-            
-            # Validate request body
-            validated_data, validation_errors = validate_request_body(request_body, pydantic_model)
+                _fail(log_ctx, 400, error_detail, file_request_id, display_request_id)
             
             if validation_errors:
                 error_detail = {
@@ -510,15 +543,10 @@ async def dynamic_prompt_handler(request: Request, path: str):
                     "details": validation_errors,
                     "hint": "Review the API documentation for correct body schema"
                 }
-                log_ctx.set_response(json.dumps(error_detail), 422)
-                try:
-                    write_log(log_ctx.to_log_entry(), file_request_id)
-                except IOError as log_err:
-                    logger.error(f"Failed to write log: {log_err}")
-                raise HTTPException(status_code=422, detail=error_detail, headers={"x-request-id": display_request_id})
+                _fail(log_ctx, 422, error_detail, file_request_id, display_request_id)
             
-            # Convert validated data to body_params (all values as strings for substitution)
-            body_params = {k: str(v) if v is not None else "" for k, v in validated_data.items()}
+            # Validated values are passed as-is; substitution stringifies them (None -> "")
+            body_params = validated_data
             logger.debug(f"Validated body params: {body_params}")
         
         # Setup user workspace (creates dirs and symlinks as needed)
@@ -546,12 +574,7 @@ async def dynamic_prompt_handler(request: Request, path: str):
                 "message": f"AI provider '{provider.name}' is not installed or not available",
                 "provider": provider.name
             }
-            log_ctx.set_response(json.dumps(error_detail), 503)
-            try:
-                write_log(log_ctx.to_log_entry(), file_request_id)
-            except IOError as log_err:
-                logger.error(f"Failed to write log: {log_err}")
-            raise HTTPException(status_code=503, detail=error_detail, headers={"x-request-id": display_request_id})
+            _fail(log_ctx, 503, error_detail, file_request_id, display_request_id)
         
         # Execute prompt
         result = executor.execute(
@@ -574,12 +597,7 @@ async def dynamic_prompt_handler(request: Request, path: str):
                 "provider": provider.name,
                 "stderr": result.stderr
             }
-            log_ctx.set_response(json.dumps(error_detail), 408)
-            try:
-                write_log(log_ctx.to_log_entry(), file_request_id)
-            except IOError as log_err:
-                logger.error(f"Failed to write log: {log_err}")
-            raise HTTPException(status_code=408, detail=error_detail, headers={"x-request-id": display_request_id})
+            _fail(log_ctx, 408, error_detail, file_request_id, display_request_id)
         
         # Handle execution failure
         if not result.success:
@@ -591,20 +609,16 @@ async def dynamic_prompt_handler(request: Request, path: str):
                 "returncode": result.returncode,
                 "stderr": result.stderr
             }
-            log_ctx.set_response(json.dumps(error_detail), 500)
-            try:
-                write_log(log_ctx.to_log_entry(), file_request_id)
-            except IOError as log_err:
-                logger.error(f"Failed to write log: {log_err}")
-            raise HTTPException(status_code=500, detail=error_detail, headers={"x-request-id": display_request_id})
+            _fail(log_ctx, 500, error_detail, file_request_id, display_request_id)
         
         # Success - update log and write before returning
-        log_ctx.set_response(result.stdout, 200)
+        log_ctx.set_response(result.stdout, 200, _parse_json_output(result.stdout))
         
         try:
-            log_path = write_log(log_ctx.to_log_entry(), file_request_id)
-            logger.debug(f"Request logged to: {log_path}")
+            enqueue_log(log_ctx.to_log_entry(), file_request_id)
         except IOError as e:
+            # Only the synchronous queue-full fallback raises here; background
+            # write failures are counted instead (see log_write_failures on /)
             logger.error(f"Failed to write log: {e}")
             raise HTTPException(
                 status_code=500,
@@ -624,9 +638,9 @@ async def dynamic_prompt_handler(request: Request, path: str):
             "message": str(e),
             "available_providers": ProviderFactory.list_providers()
         }
-        log_ctx.set_response(json.dumps(error_detail), 503)
+        log_ctx.set_json_response(error_detail, 503)
         try:
-            write_log(log_ctx.to_log_entry(), file_request_id)
+            enqueue_log(log_ctx.to_log_entry(), file_request_id)
         except:
             pass
         raise HTTPException(status_code=503, detail=error_detail, headers={"x-request-id": display_request_id})
@@ -641,9 +655,9 @@ async def dynamic_prompt_handler(request: Request, path: str):
             "message": f"Unexpected error: {str(e)}"
         }
         log_ctx.set_error("unexpected_error")
-        log_ctx.set_response(json.dumps(error_detail), 500)
+        log_ctx.set_json_response(error_detail, 500)
         try:
-            write_log(log_ctx.to_log_entry(), file_request_id)
+            enqueue_log(log_ctx.to_log_entry(), file_request_id)
         except:
             pass
         raise HTTPException(status_code=500, detail=error_detail, headers={"x-request-id": display_request_id})
@@ -3,19 +3,30 @@ OpenAPI generator - builds an OpenAPI 3.1 document from prompt files.
 First iteration: list endpoints (paths + methods). Optionally include path params
 and request body when defined in frontmatter/body validator.
 """
+import functools
+import json
+import re
+import sys
 from pathlib import Path
 from typing import Any, Dict, List
 
-from src.prompts.loader import load_prompts, PromptMetadata
-from src.prompts.body_validator import parse_body_schema
-from src.prompts.router import DynamicRouter
+from src.prompts.loader import load_prompts, prompts_fingerprint, PromptMetadata
+from src.prompts.body_validator import BodyFieldSchema, parse_body_schema
 
 
-def _path_parameters_from_route(route: str) -> List[Dict[str, Any]]:
-    """Extract FastAPI-style path parameters from a route and return OpenAPI params."""
-    import re
+# {name} or {name:path} placeholders in a route
+_ROUTE_PARAM_RE = re.compile(r"\{([a-zA-Z_][a-zA-Z0-9_]*)(?::path)?\}")
+
+
+@functools.lru_cache(maxsize=1024)
+def _path_parameters_from_route(route: str) -> tuple[Dict[str, Any], ...]:
+    """
+    Extract FastAPI-style path parameters from a route and return OpenAPI params.
+
+    Cached per route string; the returned parameter dicts are shared and must not be mutated.
+    """
     params: List[Dict[str, Any]] = []
-    for m in re.finditer(r"\{([a-zA-Z_][a-zA-Z0-9_]*)(?::path)?\}", route):
+    for m in _ROUTE_PARAM_RE.finditer(route):
         name = m.group(1)
         params.append({
             "name": name,
@@ -23,35 +34,259 @@ def _path_parameters_from_route(route: str) -> List[Dict[str, Any]]:
             "required": True,
             "schema": {"type": "string"},
         })
-    return params
+    return tuple(params)
+
+
+def _param_placeholder(m: re.Match) -> str:
+    """Replace a route parameter with a name-independent placeholder."""
+    return "{:path}" if m.group(0).endswith(":path}") else "{}"
+
+
+@functools.lru_cache(maxsize=1024)
+def _route_shape(route: str) -> tuple[str, ...]:
+    """
+    Interned route segments with parameter names erased, used as the conflict key.
+
+    /users/{id} and /users/{name} share a shape, so they are reported as a conflict
+    (they would match the same requests); {name:path} keeps a distinct placeholder.
+    """
+    return tuple(sys.intern(_ROUTE_PARAM_RE.sub(_param_placeholder, seg)) for seg in route.split("/"))
+
+
+_OP_TRANS = str.maketrans({"/": "_"})
+
+
+@functools.lru_cache(maxsize=1024)
+def _operation_path_key(path: str) -> str:
+    """Path part of an operationId: /a/b -> a_b, / -> root."""
+    return path.strip("/").translate(_OP_TRANS) or "root"
+
+
+# Static document parts, shared by every generated document and operation
+# (documents are only serialized, never mutated)
+_INFO: Dict[str, Any] = {
+    "title": "Codex API",
+    "version": "1.0.0",
+    "description": "Dynamic prompt-based AI API",
+}
+_DEFAULT_RESPONSES: Dict[str, Any] = {
+    "200": {
+        "description": "Successful response",
+        "content": {"text/plain": {"schema": {"type": "string"}}},
+    },
+    "404": {"description": "Not Found"},
+    "500": {"description": "Internal Server Error"},
+}
+
+
+# Generated documents per prompts directory:
+# path -> [fingerprint, document, serialized JSON body (filled in lazily)]
+_OPENAPI_CACHE: Dict[str, list] = {}
+
+
+def _cache_entry(prompts_dir: Path) -> list:
+    """Return the cache entry for prompts_dir, rebuilding it when a prompt file changed."""
+    fingerprint = prompts_fingerprint(prompts_dir)
+    key = str(prompts_dir)
+    cached = _OPENAPI_CACHE.get(key)
+    if fingerprint is not None and cached is not None and cached[0] == fingerprint:
+        return cached
+
+    entry = [fingerprint, _build_openapi(prompts_dir), None]
+    if fingerprint is not None:
+        _OPENAPI_CACHE[key] = entry
+    return entry
 
 
 def generate_openapi(prompts_dir: Path) -> Dict[str, Any] | Dict[str, Any]:
     """
     Generate OpenAPI 3.1 document or raise/return structured errors on conflicts.
     Returns a dict representing the OpenAPI JSON.
+
+    Results are cached until a prompt file is added, removed or edited; the
+    returned dict is shared between callers and must not be mutated.
+    """
+    return _cache_entry(prompts_dir)[1]
+
+
+def generate_openapi_bytes(prompts_dir: Path) -> tuple[Dict[str, Any], bytes]:
+    """
+    Like generate_openapi, but also return the document serialized as JSON.
+
+    The bytes are encoded the same way as FastAPI's JSONResponse and cached
+    alongside the document, so serving them skips JSON encoding.
+
+    Returns:
+        (document, UTF-8 JSON body)
+    """
+    entry = _cache_entry(prompts_dir)
+    if entry[2] is None:
+        entry[2] = json.dumps(
+            entry[1],
+            ensure_ascii=False,
+            allow_nan=False,
+            indent=None,
+            separators=(",", ":"),
+        ).encode("utf-8")
+    return entry[1], entry[2]
+
+
+def _string_schema(fs: BodyFieldSchema) -> Dict[str, Any]:
+    """OpenAPI schema for a string body field."""
+    schema: Dict[str, Any] = {"type": "string"}
+    if fs.min_length is not None:
+        schema["minLength"] = fs.min_length
+    if fs.max_length is not None:
+        schema["maxLength"] = fs.max_length
+    if fs.pattern:
+        schema["pattern"] = fs.pattern
+    if fs.enum:
+        schema["enum"] = fs.enum
+    return schema
+
+
+def _number_schema(fs: BodyFieldSchema) -> Dict[str, Any]:
+    """OpenAPI schema for a number body field (constraints via minimum/maximum)."""
+    schema: Dict[str, Any] = {"type": "number"}
+    if fs.min is not None:
+        schema["minimum"] = fs.min
+    if fs.max is not None:
+        schema["maximum"] = fs.max
+    return schema
+
+
+def _boolean_schema(fs: BodyFieldSchema) -> Dict[str, Any]:
+    """OpenAPI schema for a boolean body field."""
+    return {"type": "boolean"}
+
+
+# Body field type -> OpenAPI schema builder
+_SCHEMA_TABLE = {
+    "string": _string_schema,
+    "number": _number_schema,
+    "boolean": _boolean_schema,
+}
+
+
+# requestBody objects per prompt file: path -> (st_mtime_ns, requestBody)
+_REQUEST_BODY_CACHE: Dict[str, tuple[int, Dict[str, Any]]] = {}
+
+
+def _request_body(p: PromptMetadata) -> Dict[str, Any]:
+    """
+    Build the requestBody object for a prompt's body schema.
+
+    Memoized per prompt file until its mtime changes; the returned dict is
+    shared and must not be mutated.
     """
+    key = str(p.filepath)
+    try:
+        mtime_ns = p.filepath.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    cached = _REQUEST_BODY_CACHE.get(key)
+    if mtime_ns is not None and cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    # Build properties and required from body schema using existing parser
+    try:
+        field_schemas = parse_body_schema(p.body_schema)
+    except Exception:
+        field_schemas = []
+    properties: Dict[str, Any] = {}
+    required: List[str] = []
+    for fs in field_schemas:
+        schema_for = _SCHEMA_TABLE.get(fs.type)
+        schema: Dict[str, Any] = schema_for(fs) if schema_for else {}
+        # default and description
+        if fs.default is not None:
+            schema["default"] = fs.default
+        if fs.description:
+            schema["description"] = fs.description
+        properties[fs.name] = schema
+        if fs.required:
+            required.append(fs.name)
+
+    op_schema: Dict[str, Any] = {"type": "object", "properties": properties}
+    if required:
+        op_schema["required"] = required
+    request_body = {
+        "required": True,
+        "content": {
+            "application/json": {
+                "schema": op_schema
+            }
+        }
+    }
+    if mtime_ns is not None:
+        _REQUEST_BODY_CACHE[key] = (mtime_ns, request_body)
+    return request_body
+
+
+def _prepare_operation(p: PromptMetadata) -> tuple[str, str, Dict[str, Any]]:
+    """Return (path, method, operation) for a prompt (explicit route or GET /{filename} fallback)."""
+    if p.route:
+        path = p.route
+        method = p.method.lower()
+    else:
+        # fallback: GET /{filename}
+        path = f"/{p.filename}"
+        method = "get"
+
+    # Provide a unique operationId to avoid validator complaints
+    op_id = f"{method}_{_operation_path_key(path)}_{p.filename}"
+    operation: Dict[str, Any] = {
+        "summary": f"Prompt {p.filename}",
+        "operationId": op_id,
+        "responses": _DEFAULT_RESPONSES,
+    }
+    # Parameters: from path definition
+    if p.route:
+        params = _path_parameters_from_route(p.route)
+        if params:
+            operation["parameters"] = list(params)
+    # Request body: v1 optional; include only if body_schema is provided
+    if p.body_schema and p.method.upper() in ("POST", "PUT", "PATCH"):
+        operation["requestBody"] = _request_body(p)
+    return path, method, operation
+
+
+def _build_openapi(prompts_dir: Path) -> Dict[str, Any]:
+    """Build the OpenAPI document (or conflict errors) from the prompt files."""
     prompts = load_prompts(prompts_dir)
 
     # Validate for route conflicts: same method + same explicit path OR fallback collisions
     errors: List[Dict[str, Any]] = []
 
-    # Collect explicit routes
-    explicit_key_map: Dict[tuple[str, str], PromptMetadata] = {}
+    # Collect explicit routes, keyed by (method, route shape)
+    explicit_key_map: Dict[tuple[str, tuple[str, ...]], PromptMetadata] = {}
     # Collect fallback routes (GET /{filename})
     fallback_key_map: Dict[str, PromptMetadata] = {}
 
+    def _collision(explicit: PromptMetadata, fname: str) -> Dict[str, Any]:
+        # Conflict: explicit GET "/{filename}" (single segment) equals a fallback path
+        return {
+            "file": str(explicit.filepath),
+            "type": "route_conflict",
+            "message": f"Explicit GET /{fname} collides with fallback GET /{fname}",
+        }
+
+    # Single pass: whichever side of an explicit/fallback collision arrives second reports it
     for p in prompts:
         if p.route:
-            key = (p.method.upper(), p.route)
+            key = (p.method.upper(), _route_shape(p.route))
             if key in explicit_key_map:
                 errors.append({
                     "file": str(p.filepath),
                     "type": "route_conflict",
-                    "message": f"Explicit route {key[0]} {key[1]} also defined by {explicit_key_map[key].filename}",
+                    "message": f"Explicit route {key[0]} {p.route} also defined by {explicit_key_map[key].filename}",
                 })
             else:
                 explicit_key_map[key] = p
+                route = p.route
+                if key[0] == "GET" and route.startswith("/") and route.count("/") == 1:
+                    if route[1:] in fallback_key_map:
+                        errors.append(_collision(p, route[1:]))
         else:
             # fallback only supports GET /{filename}
             fname = p.filename
@@ -63,20 +298,9 @@ def generate_openapi(prompts_dir: Path) -> Dict[str, Any] | Dict[str, Any]:
                 })
             else:
                 fallback_key_map[fname] = p
-
-    # Conflict: explicit path equals a fallback path (GET /{filename})
-    for (method, route), p in explicit_key_map.items():
-        if method == "GET" and route.startswith("/"):
-            r = route
-            # If explicit route is exactly "/{filename}" (single segment), check collision
-            if r.count("/") == 1:  # leading slash only
-                fname = r[1:]
-                if fname in fallback_key_map:
-                    errors.append({
-                        "file": str(p.filepath),
-                        "type": "route_conflict",
-                        "message": f"Explicit {method} {route} collides with fallback GET /{fname}",
-                    })
+                explicit = explicit_key_map.get(("GET", _route_shape(f"/{fname}")))
+                if explicit is not None:
+                    errors.append(_collision(explicit, fname))
 
     if errors:
         return {"errors": errors}
@@ -85,98 +309,14 @@ def generate_openapi(prompts_dir: Path) -> Dict[str, Any] | Dict[str, Any]:
     # Use 3.0.x for broader Swagger UI compatibility
     openapi: Dict[str, Any] = {
         "openapi": "3.0.3",
-        "info": {
-            "title": "Codex API",
-            "version": "1.0.0",
-            "description": "Dynamic prompt-based AI API",
-        },
+        "info": _INFO,
         "paths": {},
     }
 
-    # Use router to mirror matching logic, but we only need to enumerate paths
-    router = DynamicRouter(prompts_dir)
-    router.prompts = prompts
-
-    # Build paths from explicit routes, then fallback filename routes
-    for p in prompts:
-        if p.route:
-            path = p.route
-            method = p.method.lower()
-        else:
-            # fallback: GET /{filename}
-            path = f"/{p.filename}"
-            method = "get"
-
-        path_item = openapi["paths"].setdefault(path, {})
-        # Provide a unique operationId to avoid validator complaints
-        op_id = f"{method}_{path.strip('/').replace('/', '_') or 'root'}_{p.filename}"
-        operation: Dict[str, Any] = {
-            "summary": f"Prompt {p.filename}",
-            "operationId": op_id,
-            "responses": {
-                "200": {
-                    "description": "Successful response",
-                    "content": {"text/plain": {"schema": {"type": "string"}}},
-                },
-                "404": {"description": "Not Found"},
-                "500": {"description": "Internal Server Error"},
-            },
-        }
-        # Parameters: from path definition
-        if p.route:
-            params = _path_parameters_from_route(p.route)
-            if params:
-                operation["parameters"] = params
-        # Request body: v1 optional; include only if body_schema is provided
-        if p.body_schema and p.method.upper() in ("POST", "PUT", "PATCH"):
-            # Build properties and required from body schema using existing parser
-            try:
-                field_schemas = parse_body_schema(p.body_schema)
-            except Exception:
-                field_schemas = []
-            properties: Dict[str, Any] = {}
-            required: List[str] = []
-            for fs in field_schemas:
-                schema: Dict[str, Any] = {}
-                if fs.type == 'string':
-                    schema["type"] = "string"
-                    if fs.min_length is not None:
-                        schema["minLength"] = fs.min_length
-                    if fs.max_length is not None:
-                        schema["maxLength"] = fs.max_length
-                    if fs.pattern:
-                        schema["pattern"] = fs.pattern
-                    if fs.enum:
-                        schema["enum"] = fs.enum
-                elif fs.type == 'number':
-                    # Use 'number' for floats; constraints via minimum/maximum
-                    schema["type"] = "number"
-                    if fs.min is not None:
-                        schema["minimum"] = fs.min
-                    if fs.max is not None:
-                        schema["maximum"] = fs.max
-                elif fs.type == 'boolean':
-                    schema["type"] = "boolean"
-                # default and description
-                if fs.default is not None:
-                    schema["default"] = fs.default
-                if fs.description:
-                    schema["description"] = fs.description
-                properties[fs.name] = schema
-                if fs.required:
-                    required.append(fs.name)
-
-            op_schema: Dict[str, Any] = {"type": "object", "properties": properties}
-            if required:
-                op_schema["required"] = required
-            operation["requestBody"] = {
-                "required": True,
-                "content": {
-                    "application/json": {
-                        "schema": op_schema
-                    }
-                }
-            }
-        path_item[method] = operation
+    # Phase 1: prepare every operation; phase 2: only insert into paths
+    prepared = [_prepare_operation(p) for p in prompts]
+    paths = openapi["paths"]
+    for path, method, operation in prepared:
+        paths.setdefault(path, {})[method] = operation
 
     return openapi
@@ -10,14 +10,16 @@ This module provides:
 """
 
 from dataclasses import dataclass
-from typing import Any
+from typing import Annotated, Any
+import functools
+import json
 import re
 import logging
 from pydantic import (
+    AfterValidator,
     create_model,
     Field,
     ValidationError,
-    field_validator,
     BaseModel,
 )
 
@@ -105,6 +107,12 @@ def parse_body_schema(body_yaml: dict[str, Any]) -> list[BodyFieldSchema]:
     return schemas
 
 
+@functools.lru_cache(maxsize=512)
+def _compile_pattern(pattern: str) -> re.Pattern:
+    """Compile a field regex once; invalid patterns raise re.error every time (not cached)."""
+    return re.compile(pattern)
+
+
 def validate_body_schema(
     schemas: list[BodyFieldSchema],
     route_params: list[str] | None = None,
@@ -143,7 +151,7 @@ def validate_body_schema(
     for schema in schemas:
         if schema.pattern:
             try:
-                re.compile(schema.pattern)
+                _compile_pattern(schema.pattern)
             except re.error as e:
                 raise PromptConfigurationError(
                     f"Field '{schema.name}' has invalid regex pattern '{schema.pattern}': {e}"
@@ -158,48 +166,148 @@ def validate_body_schema(
                 )
 
 
+def _tagged(value: Any) -> tuple[type, Any]:
+    """Pair a value with its type, so 1, 1.0 and True never share a cache key."""
+    return (value.__class__, value)
+
+
+def _schema_signature(schemas: list[BodyFieldSchema]) -> tuple:
+    """
+    Hashable signature of field schemas (BodyFieldSchema field order, enum as tuple).
+    
+    default, enum entries, min and max are type-tagged: they compare equal
+    across int/float/bool but render (and substitute) differently.
+    """
+    return tuple(
+        (
+            s.name, s.type, s.required, _tagged(s.default), s.description,
+            s.min_length, s.max_length, s.pattern,
+            tuple(map(_tagged, s.enum)) if s.enum is not None else None,
+            _tagged(s.min), _tagged(s.max), s.max_decimals,
+        )
+        for s in schemas
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _build_model_cached(signature: tuple) -> type[BaseModel]:
+    """Build (once per signature) the model for a schema signature."""
+    schemas = [
+        BodyFieldSchema(
+            name, type_, required, default[1], description,
+            min_length, max_length, pattern,
+            [v for _, v in enum] if enum is not None else None,
+            min_[1], max_[1], max_decimals,
+        )
+        for (
+            name, type_, required, default, description,
+            min_length, max_length, pattern, enum, min_, max_, max_decimals,
+        ) in signature
+    ]
+    return _build_model(schemas)
+
+
 def build_pydantic_model(schemas: list[BodyFieldSchema]) -> type[BaseModel]:
     """
     Build a dynamic Pydantic model from field schemas.
     
+    Models are cached per schema signature, so identical schemas share one
+    compiled model instead of calling create_model again.
+    
     Args:
         schemas: List of field schemas
         
     Returns:
         Dynamically created Pydantic model class
     """
-    from pydantic import ConfigDict
-    
+    signature = _schema_signature(schemas)
+    try:
+        return _build_model_cached(signature)
+    except TypeError:
+        # Unhashable values (e.g. a list default) can't be cached
+        return _build_model(schemas)
+
+
+def _check_enum(v: Any, allowed_values: list) -> Any:
+    """Reject values outside a field's enum (None passes through)."""
+    if v is not None and v not in allowed_values:
+        raise ValueError(
+            f"must be one of {allowed_values}, got '{v}'"
+        )
+    return v
+
+
+def _check_decimals(v: Any, max_dec: int) -> Any:
+    """Reject numbers with more than max_dec decimal places (None passes through)."""
+    if v is None:
+        return v
+    # For integers (max_decimals=0), check if value is an integer
+    if max_dec == 0:
+        if not isinstance(v, int) or isinstance(v, bool):
+            # If it's a float, check if it has no decimal part
+            if isinstance(v, float):
+                if v != int(v):
+                    raise ValueError(
+                        f"maximum 0 decimal places allowed (must be integer)"
+                    )
+        return v
+    # Check decimal places
+    decimal_str = str(v)
+    if '.' in decimal_str:
+        decimal_places = len(decimal_str.split('.')[1])
+        if decimal_places > max_dec:
+            raise ValueError(
+                f"maximum {max_dec} decimal places allowed, got {decimal_places}"
+            )
+    return v
+
+
+def _string_constraints(schema: BodyFieldSchema) -> dict[str, Any]:
+    """Pydantic Field constraints for a string field."""
+    constraints = {}
+    if schema.min_length is not None:
+        constraints['min_length'] = schema.min_length
+    if schema.max_length is not None:
+        constraints['max_length'] = schema.max_length
+    if schema.pattern:
+        constraints['pattern'] = schema.pattern
+    return constraints
+
+
+def _number_constraints(schema: BodyFieldSchema) -> dict[str, Any]:
+    """Pydantic Field constraints for a number field."""
+    constraints = {}
+    if schema.min is not None:
+        constraints['ge'] = schema.min
+    if schema.max is not None:
+        constraints['le'] = schema.max
+    return constraints
+
+
+def _no_constraints(schema: BodyFieldSchema) -> dict[str, Any]:
+    """Boolean fields have no Field constraints."""
+    return {}
+
+
+# Schema type -> (Python type, Field constraints builder)
+_TYPE_TABLE = {
+    'string': (str, _string_constraints),
+    'number': (float, _number_constraints),
+    'boolean': (bool, _no_constraints),
+}
+
+
+def _build_model(schemas: list[BodyFieldSchema]) -> type[BaseModel]:
+    """Create the Pydantic model for field schemas (uncached)."""
     fields = {}
-    validators = {}
     
     for schema in schemas:
-        # Determine Python type
-        if schema.type == 'string':
-            python_type = str
-        elif schema.type == 'number':
-            python_type = float
-        elif schema.type == 'boolean':
-            python_type = bool
-        else:
+        # Determine Python type and field constraints
+        try:
+            python_type, constraints_for = _TYPE_TABLE[schema.type]
+        except KeyError:
             raise ValueError(f"Unsupported type: {schema.type}")
-        
-        # Build field constraints
-        constraints = {}
-        
-        if schema.type == 'string':
-            if schema.min_length is not None:
-                constraints['min_length'] = schema.min_length
-            if schema.max_length is not None:
-                constraints['max_length'] = schema.max_length
-            if schema.pattern:
-                constraints['pattern'] = schema.pattern
-        
-        elif schema.type == 'number':
-            if schema.min is not None:
-                constraints['ge'] = schema.min
-            if schema.max is not None:
-                constraints['le'] = schema.max
+        constraints = constraints_for(schema)
         
         # Handle default and required
         if schema.default is not None:
@@ -214,6 +322,15 @@ def build_pydantic_model(schemas: list[BodyFieldSchema]) -> type[BaseModel]:
         if schema.description:
             constraints['description'] = schema.description
         
+        # Enum and maxDecimals run as shared after-validators on the field type
+        checks = []
+        if schema.enum:
+            checks.append(AfterValidator(functools.partial(_check_enum, allowed_values=schema.enum)))
+        if schema.max_decimals is not None and schema.type == 'number':
+            checks.append(AfterValidator(functools.partial(_check_decimals, max_dec=schema.max_decimals)))
+        if checks:
+            python_type = Annotated[(python_type, *checks)]
+        
         # Create field
         if constraints or schema.enum:
             if schema.enum:
@@ -225,62 +342,29 @@ def build_pydantic_model(schemas: list[BodyFieldSchema]) -> type[BaseModel]:
             fields[schema.name] = (python_type, Field(default=default_value, **constraints))
         else:
             fields[schema.name] = (python_type, default_value)
-        
-        # Add custom validators for enum and maxDecimals
-        if schema.enum:
-            validator_name = f'validate_{schema.name}_enum'
-            def make_enum_validator(field_name: str, allowed_values: list):
-                def validator(cls, v):
-                    if v is not None and v not in allowed_values:
-                        raise ValueError(
-                            f"must be one of {allowed_values}, got '{v}'"
-                        )
-                    return v
-                validator.__name__ = validator_name
-                return field_validator(field_name)(validator)
-            
-            validators[validator_name] = make_enum_validator(schema.name, schema.enum)
-        
-        if schema.max_decimals is not None and schema.type == 'number':
-            validator_name = f'validate_{schema.name}_decimals'
-            def make_decimal_validator(field_name: str, max_dec: int):
-                def validator(cls, v):
-                    if v is None:
-                        return v
-                    # For integers (max_decimals=0), check if value is an integer
-                    if max_dec == 0:
-                        if not isinstance(v, int) or isinstance(v, bool):
-                            # If it's a float, check if it has no decimal part
-                            if isinstance(v, float):
-                                if v != int(v):
-                                    raise ValueError(
-                                        f"maximum 0 decimal places allowed (must be integer)"
-                                    )
-                        return v
-                    # Check decimal places
-                    decimal_str = str(v)
-                    if '.' in decimal_str:
-                        decimal_places = len(decimal_str.split('.')[1])
-                        if decimal_places > max_dec:
-                            raise ValueError(
-                                f"maximum {max_dec} decimal places allowed, got {decimal_places}"
-                            )
-                    return v
-                validator.__name__ = validator_name
-                return field_validator(field_name)(validator)
-            
-            validators[validator_name] = make_decimal_validator(schema.name, schema.max_decimals)
     
-    # Create the model with validators
-    model = create_model(
-        'DynamicBodyModel',
-        **fields,
-        __validators__=validators
-    )
+    # Create the model
+    model = create_model('DynamicBodyModel', **fields)
     
     return model
 
 
+@functools.lru_cache(maxsize=256)
+def _defaults_for(model: type[BaseModel]) -> dict[str, Any] | None:
+    """
+    The validated result of an empty body: every field's default (None if unset).
+    
+    None when some field is required, so an empty body must go through validation.
+    Defaults are not validated by Pydantic either, so this matches model_validate({}).
+    """
+    defaults = {}
+    for name, field in model.model_fields.items():
+        if field.is_required():
+            return None
+        defaults[name] = field.default
+    return defaults
+
+
 def validate_request_body(
     body: dict[str, Any],
     model: type[BaseModel],
@@ -297,14 +381,54 @@ def validate_request_body(
         - If valid: (validated_data_dict, None)
         - If invalid: (None, list_of_error_dicts)
     """
+    # Empty body with nothing required: the result is just the defaults
+    if not body:
+        defaults = _defaults_for(model)
+        if defaults is not None:
+            return defaults.copy(), None
+    
     try:
-        validated = model(**body)
-        return validated.model_dump(), None
+        # The model's core validator is compiled once with the (cached) model;
+        # model_validate feeds it the dict directly, without a kwargs copy
+        validated = model.model_validate(body)
+        # Body models are flat (str/float/bool fields), so the instance dict
+        # already holds the validated values; skip model_dump's serializer pass
+        return validated.__dict__.copy(), None
     except ValidationError as e:
         errors = format_validation_errors(e, body)
         return None, errors
 
 
+def validate_request_body_json(
+    raw_body: bytes,
+    model: type[BaseModel],
+) -> tuple[dict[str, Any] | None, list[dict[str, Any]] | None]:
+    """
+    Validate a raw JSON request body against Pydantic model.
+    
+    Parsing and validation run in one pass inside pydantic-core, so valid
+    bodies never become an intermediate dict. The body is only decoded with
+    json.loads to report received values when validation fails.
+    
+    Args:
+        raw_body: Raw request body bytes (JSON)
+        model: Pydantic model to validate against
+        
+    Returns:
+        Tuple of (validated_data, errors), as validate_request_body
+        
+    Raises:
+        json.JSONDecodeError: If raw_body is not valid JSON
+    """
+    try:
+        validated = model.model_validate_json(raw_body)
+        return validated.__dict__.copy(), None
+    except ValidationError as e:
+        body = json.loads(raw_body)
+        errors = format_validation_errors(e, body if isinstance(body, dict) else {})
+        return None, errors
+
+
 def format_validation_errors(
     validation_error: ValidationError,
     received_body: dict[str, Any],
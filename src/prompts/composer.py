@@ -12,6 +12,8 @@ Rules:
 from __future__ import annotations
 
 import logging
+import os
+import stat
 from pathlib import Path
 from typing import Optional
 
@@ -20,20 +22,49 @@ from src.config import Config
 logger = logging.getLogger(__name__)
 
 
+# AGENTS.md content per file path: (st_mtime_ns, content)
+_AGENTS_CACHE: dict[str, tuple[int, str]] = {}
+
+
 def _read_agents_file(project_id: str) -> Optional[str]:
-    """Read AGENTS.md content for a project if present."""
+    """Read AGENTS.md content for a project if present (cached until its mtime changes)."""
     agents_path: Path = Config.get_project_dir(project_id) / "AGENTS.md"
+    key = str(agents_path)
+    try:
+        st = os.stat(key)
+    except FileNotFoundError:
+        _AGENTS_CACHE.pop(key, None)
+        logger.debug(f"No AGENTS.md found for project '{project_id}'")
+        return None
+    except OSError as e:
+        logger.warning(f"Failed to read AGENTS.md for project '{project_id}': {e}")
+        return None
+
+    if not stat.S_ISREG(st.st_mode):
+        logger.debug(f"No AGENTS.md found for project '{project_id}'")
+        return None
+
+    cached = _AGENTS_CACHE.get(key)
+    if cached is not None and cached[0] == st.st_mtime_ns:
+        return cached[1]
+
+    # Read through one open file and record the mtime of what was actually read,
+    # so a write racing the stat above cannot pin stale content in the cache
     try:
-        if agents_path.exists() and agents_path.is_file():
-            content = agents_path.read_text(encoding="utf-8")
-            logger.debug(f"Loaded AGENTS.md for project '{project_id}' ({len(content)} bytes)")
-            return content
+        with open(key, encoding="utf-8") as f:
+            mtime_ns = os.fstat(f.fileno()).st_mtime_ns
+            content = f.read()
+    except FileNotFoundError:
+        _AGENTS_CACHE.pop(key, None)
         logger.debug(f"No AGENTS.md found for project '{project_id}'")
         return None
-    except Exception as e:
+    except (OSError, UnicodeDecodeError) as e:
         # Do not fail request if AGENTS.md cannot be read; just log and continue
         logger.warning(f"Failed to read AGENTS.md for project '{project_id}': {e}")
         return None
+    _AGENTS_CACHE[key] = (mtime_ns, content)
+    logger.debug(f"Loaded AGENTS.md for project '{project_id}' ({len(content)} bytes)")
+    return content
 
 
 def compose_prompt(prompt_body: str, project_id: str) -> str:
@@ -3,6 +3,7 @@ Prompt executor module - executes prompts with AI provider
 """
 import logging
 from pathlib import Path
+from typing import Any
 
 from src.prompts.loader import PromptMetadata
 from src.prompts.composer import compose_prompt
@@ -33,7 +34,7 @@ class PromptExecutor:
         self,
         prompt: PromptMetadata,
         route_params: dict[str, str] | None = None,
-        body_params: dict[str, str] | None = None,
+        body_params: dict[str, Any] | None = None,
         dry_run: bool = False,
         project_id: str = "test",
     ) -> AIProviderResult:
@@ -50,33 +51,33 @@ class PromptExecutor:
             AIProviderResult from provider execution
         """
         # Compose with project agents (AGENTS.md) then substitute variables
-        composed = compose_prompt(prompt_body=prompt.raw_content, project_id=project_id)
+        composed = compose_prompt(prompt_body=prompt.get_body(), project_id=project_id)
         processed_prompt = substitute_variables(
             composed,
             route_params=route_params,
             body_params=body_params
         )
-        logger.debug(f"Processed prompt: {processed_prompt[:100]}...")
+        logger.debug("Processed prompt: %.100s...", processed_prompt)
         
         # Determine which provider to use
         provider_name = prompt.agent if prompt.agent else config.AI_PROVIDER
         
-        # Create provider
+        # Get provider (the factory shares one instance per provider/workspace/timeout)
         provider = ProviderFactory.create(
             provider_name=provider_name,
             workspace_dir=self.workspace_dir,
             timeout=self.timeout
         )
         
-        logger.info(f"Executing prompt '{prompt.filename}' with provider '{provider.name}'")
+        logger.info("Executing prompt '%s' with provider '%s'", prompt.filename, provider.name)
         
         # Execute with model override if specified
         if prompt.model:
-            logger.info(f"Using model override: {prompt.model}")
+            logger.info("Using model override: %s", prompt.model)
             result = provider.execute(processed_prompt, model=prompt.model, dry_run=dry_run)
         else:
             result = provider.execute(processed_prompt, dry_run=dry_run)
         
-        logger.debug(f"Execution result: success={result.success}, returncode={result.returncode}")
+        logger.debug("Execution result: success=%s, returncode=%s", result.success, result.returncode)
         
         return result
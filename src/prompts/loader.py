@@ -1,17 +1,25 @@
 """
 Prompt loader module - loads and parses prompt files with YAML frontmatter
 """
+import json
 import logging
+import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 import frontmatter
+import yaml
+
+from src.config import Config
 
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class PromptMetadata:
     """Metadata for a prompt file"""
     filename: str  # without .md extension
@@ -20,17 +28,134 @@ class PromptMetadata:
     route: str | None  # explicit route or None for fallback
     model: str | None  # model override
     agent: str | None  # provider override
-    raw_content: str  # prompt body after frontmatter
+    raw_content: str | None  # prompt body after frontmatter (None until get_body() reads it)
     body_schema: dict[str, Any] | None = None  # body validation schema
     dry: bool | None = None  # dry-run mode override
+    body_offset: int | None = None  # byte offset of the body in filepath, for lazy loading
+    
+    def __post_init__(self):
+        # Short, highly repeated strings; interned so route matching compares by identity
+        self.filename = sys.intern(self.filename)
+        self.method = sys.intern(self.method)
+        if self.agent is not None:
+            self.agent = sys.intern(self.agent)
+    
+    def get_body(self) -> str:
+        """
+        Return the prompt body, reading it from disk on first use.
+        
+        Prompts loaded with a frontmatter block only index the frontmatter;
+        the body is read (from body_offset) when a request actually uses it.
+        """
+        if self.raw_content is None:
+            with open(self.filepath, 'rb') as f:
+                f.seek(self.body_offset or 0)
+                self.raw_content = _decode(f.read()).strip()
+        return self.raw_content
+
+
+def prompts_fingerprint(prompts_dir: Path) -> tuple | None:
+    """
+    Cheap change signature for a prompts directory.
+    
+    One scandir plus a stat per *.md file; catches added, removed and edited
+    prompts without re-parsing them. Used to invalidate caches built from
+    load_prompts().
+    
+    Returns:
+        Hashable fingerprint, or None if the directory is missing
+    """
+    try:
+        with os.scandir(prompts_dir) as it:
+            return tuple(sorted(
+                (e.name, e.stat().st_mtime_ns, e.stat().st_size)
+                for e in it if e.name.endswith(".md")
+            ))
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+# Above this many prompt files, load_prompts parses them on a thread pool
+_PARALLEL_LOAD_THRESHOLD = 16
+
+# Parsed prompts are cached next to the prompt files, keyed by prompts_fingerprint()
+PROMPT_CACHE_FILENAME = ".prompts-cache.json"
+_PROMPT_CACHE_VERSION = 2
+
+# Directories where writing the cache failed; they are not retried (or logged) again
+_cache_write_failed: set[Path] = set()
 
 
-def load_prompts(prompts_dir: Path) -> list[PromptMetadata]:
+def _read_prompt_cache(prompts_dir: Path, fingerprint: tuple) -> list[PromptMetadata] | None:
+    """Return cached prompts if the cache file matches fingerprint, else None."""
+    try:
+        with open(prompts_dir / PROMPT_CACHE_FILENAME, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get("version") != _PROMPT_CACHE_VERSION:
+            return None
+        if [tuple(entry) for entry in data["fingerprint"]] != list(fingerprint):
+            return None
+        return [
+            PromptMetadata(filepath=prompts_dir / item.pop("file"), **item)
+            for item in data["prompts"]
+        ]
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.debug(f"Ignoring unreadable prompt cache in {prompts_dir}: {e}")
+        return None
+
+
+def _write_prompt_cache(prompts_dir: Path, fingerprint: tuple, prompts: list[PromptMetadata]) -> None:
+    """Atomically write the prompt cache; best effort (read-only dirs are fine)."""
+    if prompts_dir in _cache_write_failed:
+        return
+    data = {
+        "version": _PROMPT_CACHE_VERSION,
+        "fingerprint": fingerprint,
+        "prompts": [
+            {
+                "file": p.filepath.name,
+                "filename": p.filename,
+                "method": p.method,
+                "route": p.route,
+                "model": p.model,
+                "agent": p.agent,
+                "raw_content": p.raw_content,
+                "body_schema": p.body_schema,
+                "dry": p.dry,
+                "body_offset": p.body_offset,
+            }
+            for p in prompts
+        ],
+    }
+    try:
+        text = json.dumps(data, ensure_ascii=False)
+        # Frontmatter values JSON can't round-trip (dates, non-string keys) stay uncached
+        if json.loads(text)["prompts"] != data["prompts"]:
+            return
+        tmp_path = prompts_dir / f"{PROMPT_CACHE_FILENAME}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp_path, prompts_dir / PROMPT_CACHE_FILENAME)
+    except OSError as e:
+        _cache_write_failed.add(prompts_dir)
+        logger.warning(f"Could not write prompt cache in {prompts_dir}, not retrying: {e}")
+    except (TypeError, ValueError) as e:
+        logger.debug(f"Could not write prompt cache in {prompts_dir}: {e}")
+
+
+def load_prompts(prompts_dir: Path, use_cache: bool | None = None) -> list[PromptMetadata]:
     """
     Load all prompt files from directory and parse their frontmatter.
     
+    With the prompt cache enabled (PROMPT_CACHE_ENABLED, off by default), parsed
+    prompts are stored in .prompts-cache.json inside prompts_dir and reused
+    while no *.md file is added, removed or edited.
+    
     Args:
         prompts_dir: Directory containing *.md prompt files
+        use_cache: Read/write the prompt cache (defaults to Config.PROMPT_CACHE_ENABLED)
         
     Returns:
         List of PromptMetadata objects
@@ -45,6 +170,15 @@ def load_prompts(prompts_dir: Path) -> list[PromptMetadata]:
         logger.warning(f"Prompts path is not a directory: {prompts_dir}")
         return prompts
     
+    if use_cache is None:
+        use_cache = Config.PROMPT_CACHE_ENABLED
+    fingerprint = prompts_fingerprint(prompts_dir) if use_cache else None
+    if fingerprint:
+        cached = _read_prompt_cache(prompts_dir, fingerprint)
+        if cached is not None:
+            logger.info(f"Loaded {len(cached)} prompt(s) from cache in {prompts_dir}")
+            return cached
+    
     # Scan for .md files
     md_files = sorted(prompts_dir.glob("*.md"))
     
@@ -52,72 +186,160 @@ def load_prompts(prompts_dir: Path) -> list[PromptMetadata]:
         logger.info(f"No prompt files found in {prompts_dir}")
         return prompts
     
-    for filepath in md_files:
-        try:
-            # Read and parse frontmatter
-            with open(filepath, 'r', encoding='utf-8') as f:
-                post = frontmatter.load(f)
-            
-            # Extract filename without extension
-            filename = filepath.stem
-            
-            # Extract frontmatter fields with defaults
-            metadata = post.metadata if isinstance(post.metadata, dict) else {}
-            
-            method = str(metadata.get('method', 'GET')).upper()
-            route = metadata.get('route')
-            if route is not None:
-                route = str(route)
-            
-            model = metadata.get('model')
-            if model is not None:
-                model = str(model)
-            
-            agent = metadata.get('agent')
-            if agent is not None:
-                agent = str(agent)
-            
-            # Get dry-run mode if present
-            dry = metadata.get('dry')
-            if dry is not None:
-                # Parse as boolean
-                if isinstance(dry, bool):
-                    pass  # Already boolean
-                elif isinstance(dry, str):
-                    dry = dry.lower() in ('true', '1', 'yes')
-                else:
-                    dry = bool(dry)
-            
-            # Get body schema if present
-            body_schema = metadata.get('body')
-            if body_schema is not None and not isinstance(body_schema, dict):
-                logger.warning(f"Prompt {filename}: 'body' must be a dict, ignoring")
-                body_schema = None
-            
-            # Get prompt body content
-            raw_content = post.content.strip()
-            
-            prompt = PromptMetadata(
-                filename=filename,
-                filepath=filepath,
-                method=method,
-                route=route,
-                model=model,
-                agent=agent,
-                raw_content=raw_content,
-                body_schema=body_schema,
-                dry=dry
-            )
-            
-            prompts.append(prompt)
-            logger.debug(f"Loaded prompt: {filename} (method={method}, route={route})")
-            
-        except Exception as e:
-            logger.warning(f"Failed to load prompt file {filepath}: {e}")
-            # Skip malformed files, continue with others
-            continue
+    # Large directories parse files concurrently to overlap file I/O; map keeps file order
+    if len(md_files) > _PARALLEL_LOAD_THRESHOLD:
+        workers = min(8, os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            parsed = list(pool.map(_parse_prompt_file, md_files))
+    else:
+        parsed = [_parse_prompt_file(filepath) for filepath in md_files]
+    prompts.extend(prompt for prompt in parsed if prompt is not None)
     
     logger.info(f"Loaded {len(prompts)} prompt(s) from {prompts_dir}")
     logger.debug(f"Prompts: {[p.filename for p in prompts]}")
     
+    if fingerprint:
+        _write_prompt_cache(prompts_dir, fingerprint, prompts)
+    
     return prompts
+
+
+# Same delimiter rule as python-frontmatter's YAML handler
+_FM_BOUNDARY = re.compile(r"^-{3,}\s*$", re.MULTILINE)
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _split_frontmatter(text: str) -> tuple[Any, str]:
+    """
+    Split a prompt file into (metadata, content).
+    
+    YAML frontmatter is parsed directly with libyaml's CSafeLoader when
+    available; anything without a leading --- boundary goes through
+    frontmatter.loads as before.
+    """
+    text = text.strip()
+    if not _FM_BOUNDARY.match(text):
+        post = frontmatter.loads(text)
+        return post.metadata, post.content
+    parts = _FM_BOUNDARY.split(text, 2)
+    if len(parts) != 3:
+        # Opening boundary without a closing one: no frontmatter
+        return {}, text
+    _, fm, content = parts
+    metadata = yaml.load(fm, Loader=_YAML_LOADER)
+    return (metadata if isinstance(metadata, dict) else {}), content.strip()
+
+
+# A frontmatter delimiter line (bytes, including its line ending)
+_FM_LINE = re.compile(rb"-{3,}\s*")
+
+
+def _decode(data: bytes) -> str:
+    """Decode file bytes like text-mode reads do (UTF-8, universal newlines)."""
+    return data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+
+
+def _read_frontmatter(filepath: Path) -> tuple[Any, str | None, int | None]:
+    """
+    Read a prompt file's frontmatter.
+    
+    Returns:
+        (metadata, content, body_offset): when the file opens with a ---
+        delimited block only the frontmatter is read and content is None
+        with body_offset pointing past the closing delimiter; otherwise the
+        whole file is parsed and body_offset is None.
+    """
+    with open(filepath, 'rb') as f:
+        if _FM_LINE.fullmatch(f.readline()):
+            fm_lines = []
+            while line := f.readline():
+                if _FM_LINE.fullmatch(line):
+                    metadata = yaml.load(_decode(b"".join(fm_lines)), Loader=_YAML_LOADER)
+                    return (metadata if isinstance(metadata, dict) else {}), None, f.tell()
+                fm_lines.append(line)
+        f.seek(0)
+        text = _decode(f.read())
+    metadata, content = _split_frontmatter(text)
+    return metadata, content, None
+
+
+# String values of the 'dry' frontmatter field that mean True
+_DRY_TRUTHY = frozenset(('true', '1', 'yes'))
+
+
+def _optional_str(value: Any) -> str | None:
+    """None stays None; anything else becomes a string"""
+    return value if value is None or value.__class__ is str else str(value)
+
+
+def _coerce_metadata(
+    metadata: dict[str, Any], filename: str
+) -> tuple[str, str | None, str | None, str | None, bool | None, dict[str, Any] | None]:
+    """
+    Normalize frontmatter fields with their defaults.
+    
+    Returns:
+        (method, route, model, agent, dry, body_schema)
+    """
+    get = metadata.get
+    method = get('method', 'GET')
+    method = (method if method.__class__ is str else str(method)).upper()
+    
+    # Get dry-run mode if present, parsed as boolean
+    dry = get('dry')
+    if dry is not None and dry.__class__ is not bool:
+        dry = dry.lower() in _DRY_TRUTHY if isinstance(dry, str) else bool(dry)
+    
+    # Get body schema if present
+    body_schema = get('body')
+    if body_schema is not None and not isinstance(body_schema, dict):
+        logger.warning(f"Prompt {filename}: 'body' must be a dict, ignoring")
+        body_schema = None
+    
+    return (
+        method,
+        _optional_str(get('route')),
+        _optional_str(get('model')),
+        _optional_str(get('agent')),
+        dry,
+        body_schema,
+    )
+
+
+def _parse_prompt_file(filepath: Path) -> PromptMetadata | None:
+    """Parse one prompt file; malformed files are logged and return None."""
+    try:
+        # Read and parse frontmatter (the body is left on disk when possible)
+        metadata, content, body_offset = _read_frontmatter(filepath)
+        
+        # Extract filename without extension
+        filename = filepath.stem
+        
+        # Extract frontmatter fields with defaults
+        if not isinstance(metadata, dict):
+            metadata = {}
+        method, route, model, agent, dry, body_schema = _coerce_metadata(metadata, filename)
+        
+        # Get prompt body content
+        raw_content = content.strip() if content is not None else None
+        
+        prompt = PromptMetadata(
+            filename=filename,
+            filepath=filepath,
+            method=method,
+            route=route,
+            model=model,
+            agent=agent,
+            raw_content=raw_content,
+            body_schema=body_schema,
+            dry=dry,
+            body_offset=body_offset
+        )
+        
+        logger.debug(f"Loaded prompt: {filename} (method={method}, route={route})")
+        return prompt
+        
+    except Exception as e:
+        logger.warning(f"Failed to load prompt file {filepath}: {e}")
+        # Skip malformed files, continue with others
+        return None
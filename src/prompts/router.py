@@ -3,6 +3,7 @@ Route matcher module - matches HTTP requests to prompt files
 """
 import re
 import logging
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Literal
@@ -13,7 +14,64 @@ from src.prompts.loader import PromptMetadata, load_prompts
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+# {name} -> (?P<name>[^/]+) (match until next slash)
+# {path:path} -> (?P<path>.+) (match everything)
+_SEGMENT_PARAM_RE = re.compile(r'\{([a-zA-Z_][a-zA-Z0-9_]*)\}')
+_PATH_PARAM_RE = re.compile(r'\{([a-zA-Z_][a-zA-Z0-9_]*):path\}')
+
+
+def _route_to_regex(route: str, prefix: str = "") -> str:
+    """
+    Translate a FastAPI-style route into an (unanchored) regex with named groups.
+    
+    Supports:
+    - {name} - matches single path segment
+    - {path:path} - matches entire remaining path (including slashes)
+    
+    Args:
+        route: Route pattern like "/user/{name}"
+        prefix: Prepended to every group name (keeps names unique in combined patterns)
+    """
+    regex_pattern = _SEGMENT_PARAM_RE.sub(rf'(?P<{prefix}\1>[^/]+)', route)
+    return _PATH_PARAM_RE.sub(rf'(?P<{prefix}\1>.+)', regex_pattern)
+
+
+def _compile_method_routes(
+    routes: list[tuple[PromptMetadata, re.Pattern]],
+) -> re.Pattern | None:
+    """
+    Combine one method's routes into a single alternation, in priority order.
+    
+    Route i becomes the outer group _r{i} and its parameters _r{i}_<name>, so the
+    winning route is m.lastgroup. Returns None if the combined pattern does not
+    compile (callers then match routes one by one).
+    """
+    alternatives = [
+        f"(?P<_r{i}>{_route_to_regex(prompt.route, f'_r{i}_')})"
+        for i, (prompt, _) in enumerate(routes)
+    ]
+    try:
+        return re.compile('|'.join(alternatives))
+    except re.error as e:
+        logger.warning(f"Could not combine routes into one pattern, matching one by one: {e}")
+        return None
+
+
+def _compile_route(route: str) -> re.Pattern | None:
+    """
+    Compile a route into a pattern (used with fullmatch), once per prompt load.
+    
+    Returns:
+        Compiled pattern, or None (logged) if the route is not a valid pattern
+    """
+    try:
+        return re.compile(_route_to_regex(route))
+    except re.error as e:
+        logger.warning(f"Invalid route pattern '{route}': {e}")
+        return None
+
+
+@dataclass(slots=True)
 class RouteMatch:
     """Result of route matching"""
     prompt: PromptMetadata
@@ -33,10 +91,43 @@ class DynamicRouter:
         """
         self.prompts_dir = prompts_dir
         self.prompts: list[PromptMetadata] = []
+        # Explicit-route prompts with their compiled patterns, in load order
+        self._explicit: list[tuple[PromptMetadata, re.Pattern]] = []
+        # Per method: (combined alternation or None, routes in priority order)
+        self._by_method: dict[str, tuple[re.Pattern | None, list[tuple[PromptMetadata, re.Pattern]]]] = {}
+        # Parameter-free routes: (method, path) -> prompt, checked before any regex
+        self._static: dict[tuple[str, str], PromptMetadata] = {}
+        # Fallback routes: filename -> prompt
+        self._by_filename: dict[str, PromptMetadata] = {}
     
     def load_prompts(self) -> None:
-        """Load all prompts from directory"""
+        """Load all prompts from directory and compile their route patterns"""
         self.prompts = load_prompts(self.prompts_dir)
+        self._by_filename = {}
+        for prompt in self.prompts:
+            self._by_filename.setdefault(prompt.filename, prompt)
+        self._explicit = []
+        for prompt in self.prompts:
+            if prompt.route is None:
+                continue
+            pattern = _compile_route(prompt.route)
+            if pattern is not None:
+                self._explicit.append((prompt, pattern))
+        buckets: dict[str, list[tuple[PromptMetadata, re.Pattern]]] = {}
+        for prompt, pattern in self._explicit:
+            buckets.setdefault(prompt.method, []).append((prompt, pattern))
+        self._by_method = {
+            method: (_compile_method_routes(routes), routes)
+            for method, routes in buckets.items()
+        }
+        # A static route only takes the fast path if it is also what the regex
+        # matching would pick for that exact path (no earlier route shadows it)
+        self._static = {}
+        for prompt, _ in self._explicit:
+            if "{" not in prompt.route:
+                match = self._match_explicit(prompt.method, prompt.route)
+                if match is not None and match.prompt is prompt:
+                    self._static.setdefault((prompt.method, prompt.route), prompt)
         logger.info(f"Router loaded {len(self.prompts)} prompt(s)")
     
     def match_route(self, method: str, path: str) -> RouteMatch | None:
@@ -54,47 +145,63 @@ class DynamicRouter:
         Returns:
             RouteMatch if matched, None otherwise
         """
-        method = method.upper()
-        
-        # Try explicit route matching first
-        match = self._match_explicit(method, path)
+        # Prompt methods are interned (see PromptMetadata), so lookups compare by identity
+        method = sys.intern(method.upper())
+        
+        # Try explicit route matching first (static routes by dict lookup)
+        prompt = self._static.get((method, path))
+        if prompt is not None:
+            match = RouteMatch(prompt=prompt, match_type="explicit", path_params={})
+        else:
+            match = self._match_explicit(method, path)
         if match:
-            logger.info(f"Matched explicit route: {match.prompt.filename} ({method} {path})")
+            logger.info("Matched explicit route: %s (%s %s)", match.prompt.filename, method, path)
             return match
         
         # Try fallback filename matching
         match = self._match_fallback(method, path)
         if match:
-            logger.info(f"Matched fallback route: {match.prompt.filename} ({method} {path})")
+            logger.info("Matched fallback route: %s (%s %s)", match.prompt.filename, method, path)
             return match
         
-        logger.debug(f"No route match for {method} {path}")
+        logger.debug("No route match for %s %s", method, path)
         return None
     
     def _match_explicit(self, method: str, path: str) -> RouteMatch | None:
         """
         Match against prompts with explicit route configuration.
         
-        Returns first match found.
+        Returns first match found (one regex run over all routes of the method).
         """
-        for prompt in self.prompts:
-            if prompt.route is None:
-                continue
-            
-            # Check method matches
-            if prompt.method != method:
-                continue
-            
-            # Check path pattern matches
-            path_params = self._extract_path_params(prompt.route, path)
-            if path_params is not None:
-                return RouteMatch(
-                    prompt=prompt,
-                    match_type="explicit",
-                    path_params=path_params
-                )
+        entry = self._by_method.get(method)
+        if entry is None:
+            return None
+        combined, routes = entry
+        
+        if combined is None:
+            for prompt, pattern in routes:
+                match = pattern.fullmatch(path)
+                if match:
+                    return RouteMatch(
+                        prompt=prompt,
+                        match_type="explicit",
+                        path_params=match.groupdict()
+                    )
+            return None
         
-        return None
+        match = combined.fullmatch(path)
+        if match is None:
+            return None
+        
+        # The outer group of the winning route closes last: _r{i}
+        winner = match.lastgroup
+        prompt, pattern = routes[int(winner[2:])]
+        prefix = f"{winner}_"
+        return RouteMatch(
+            prompt=prompt,
+            match_type="explicit",
+            path_params={name: match.group(prefix + name) for name in pattern.groupindex}
+        )
     
     def _match_fallback(self, method: str, path: str) -> RouteMatch | None:
         """
@@ -117,59 +224,11 @@ class DynamicRouter:
             return None
         
         # Find prompt with matching filename
-        for prompt in self.prompts:
-            if prompt.filename == filename:
-                return RouteMatch(
-                    prompt=prompt,
-                    match_type="fallback",
-                    path_params={}
-                )
-        
-        return None
-    
-    def _extract_path_params(self, pattern: str, path: str) -> dict[str, str] | None:
-        """
-        Extract path parameters from URL path using FastAPI-style pattern.
-        
-        Supports:
-        - {name} - matches single path segment
-        - {path:path} - matches entire remaining path (including slashes)
-        
-        Args:
-            pattern: Route pattern like "/user/{name}" or "/files/{path:path}"
-            path: Actual request path like "/user/alice"
-            
-        Returns:
-            Dictionary of extracted parameters, or None if no match
-        """
-        # Convert FastAPI-style pattern to regex
-        regex_pattern = pattern
-        
-        # Find all {param} and {param:path} patterns
-        param_pattern = re.compile(r'\{([a-zA-Z_][a-zA-Z0-9_]*)(?::path)?\}')
-        
-        # Track parameter names and types
-        params_info = []
-        for match in param_pattern.finditer(pattern):
-            param_name = match.group(1)
-            is_path_type = ":path}" in match.group(0)
-            params_info.append((param_name, is_path_type))
-        
-        # Replace {param} with named capture groups
-        # {name} -> (?P<name>[^/]+) (match until next slash)
-        # {path:path} -> (?P<path>.+) (match everything)
-        regex_pattern = re.sub(r'\{([a-zA-Z_][a-zA-Z0-9_]*)\}', r'(?P<\1>[^/]+)', regex_pattern)
-        regex_pattern = re.sub(r'\{([a-zA-Z_][a-zA-Z0-9_]*):path\}', r'(?P<\1>.+)', regex_pattern)
-        
-        # Escape special regex characters except our named groups
-        # Add anchors for exact match
-        regex_pattern = f'^{regex_pattern}$'
-        
-        try:
-            match = re.match(regex_pattern, path)
-            if match:
-                return match.groupdict()
-            return None
-        except re.error as e:
-            logger.warning(f"Invalid route pattern '{pattern}': {e}")
+        prompt = self._by_filename.get(filename)
+        if prompt is None:
             return None
+        return RouteMatch(
+            prompt=prompt,
+            match_type="fallback",
+            path_params={}
+        )
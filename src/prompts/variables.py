@@ -1,8 +1,10 @@
 """
 Variable substitution module - replaces ${var} and ${var:default} patterns
 """
+import functools
 import re
 import logging
+from typing import Any
 
 
 logger = logging.getLogger(__name__)
@@ -18,10 +20,20 @@ VARIABLE_PATTERN = re.compile(
 )
 
 
+# Shared stand-in for missing params (never mutated) and lookup-miss marker
+_EMPTY: dict[str, Any] = {}
+_MISSING = object()
+
+
+def _to_str(value: Any) -> str:
+    """Stringify a body value for substitution (None -> empty string)"""
+    return "" if value is None else str(value)
+
+
 def substitute_variables(
     template: str,
     route_params: dict[str, str] | None = None,
-    body_params: dict[str, str] | None = None,
+    body_params: dict[str, Any] | None = None,
 ) -> str:
     """
     Replace variable placeholders in template with values from parameters.
@@ -39,6 +51,7 @@ def substitute_variables(
         template: String containing variable placeholders
         route_params: Dictionary of route parameter name -> value mappings
         body_params: Dictionary of body field name -> value mappings
+            (values are stringified here; None becomes an empty string)
         
     Returns:
         String with variables substituted
@@ -53,56 +66,90 @@ def substitute_variables(
         >>> substitute_variables("Tone: ${body.tone:neutral}", body_params={})
         'Tone: neutral'
     """
-    route_params = route_params or {}
-    body_params = body_params or {}
+    # Static prompt bodies have nothing to substitute
+    if "${" not in template:
+        return template
     
-    def replace_match(match: re.Match) -> str:
-        namespace = match.group(1)  # 'route', 'body', or None
-        var_name = match.group(2)
-        default_value = match.group(3)
-        
-        # Handle namespaced variables
-        if namespace == 'route':
-            if var_name in route_params:
-                value = route_params[var_name]
-                logger.debug(f"Substituting ${{route.{var_name}}} with '{value}'")
-                return value
-        elif namespace == 'body':
-            if var_name in body_params:
-                value = str(body_params[var_name])
-                logger.debug(f"Substituting ${{body.{var_name}}} with '{value}'")
-                return value
+    route_params = route_params or _EMPTY
+    body_params = body_params or _EMPTY
+    
+    parts = []
+    for token in _tokenize(template):
+        if token.__class__ is str:
+            parts.append(token)
         else:
-            # Legacy syntax: check route_params first, then body_params
-            if var_name in route_params:
-                value = route_params[var_name]
-                logger.warning(
-                    f"Using deprecated syntax ${{{var_name}}}. "
-                    f"Use ${{route.{var_name}}} for route parameters."
-                )
-                return value
-            elif var_name in body_params:
-                value = str(body_params[var_name])
-                logger.warning(
-                    f"Using deprecated syntax ${{{var_name}}}. "
-                    f"Use ${{body.{var_name}}} for body fields."
-                )
-                return value
-        
-        # Use default if provided
-        if default_value is not None:
-            prefix = f"{namespace}." if namespace else ""
-            logger.debug(
-                f"Substituting ${{{prefix}{var_name}}} with default '{default_value}'"
+            parts.append(_resolve(*token, route_params, body_params))
+    return "".join(parts)
+
+
+@functools.lru_cache(maxsize=256)
+def _tokenize(template: str) -> tuple[str | tuple[str | None, str, str | None], ...]:
+    """
+    Split a template into literal strings and (namespace, name, default) placeholders.
+    
+    Cached per template text, so repeated requests for the same prompt skip the regex scan.
+    """
+    tokens: list[str | tuple[str | None, str, str | None]] = []
+    pos = 0
+    for match in VARIABLE_PATTERN.finditer(template):
+        if match.start() > pos:
+            tokens.append(template[pos:match.start()])
+        tokens.append(match.groups())
+        pos = match.end()
+    if pos < len(template):
+        tokens.append(template[pos:])
+    return tuple(tokens)
+
+
+def _resolve(
+    namespace: str | None,
+    var_name: str,
+    default_value: str | None,
+    route_params: dict[str, str],
+    body_params: dict[str, Any],
+) -> str:
+    """Resolve a single placeholder ('route', 'body' or legacy None namespace)."""
+    # Handle namespaced variables
+    if namespace == 'route':
+        value = route_params.get(var_name, _MISSING)
+        if value is not _MISSING:
+            logger.debug("Substituting ${route.%s} with '%s'", var_name, value)
+            return value
+    elif namespace == 'body':
+        value = body_params.get(var_name, _MISSING)
+        if value is not _MISSING:
+            value = _to_str(value)
+            logger.debug("Substituting ${body.%s} with '%s'", var_name, value)
+            return value
+    else:
+        # Legacy syntax: check route_params first, then body_params
+        value = route_params.get(var_name, _MISSING)
+        if value is not _MISSING:
+            logger.warning(
+                "Using deprecated syntax ${%s}. Use ${route.%s} for route parameters.",
+                var_name, var_name
             )
-            return default_value
-        
-        # No value and no default - use empty string
-        prefix = f"{namespace}." if namespace else ""
+            return value
+        value = body_params.get(var_name, _MISSING)
+        if value is not _MISSING:
+            value = _to_str(value)
+            logger.warning(
+                "Using deprecated syntax ${%s}. Use ${body.%s} for body fields.",
+                var_name, var_name
+            )
+            return value
+    
+    # Use default if provided
+    if default_value is not None:
         logger.debug(
-            f"Substituting ${{{prefix}{var_name}}} with empty string (not found)"
+            "Substituting ${%s%s} with default '%s'",
+            f"{namespace}." if namespace else "", var_name, default_value
         )
-        return ""
+        return default_value
     
-    result = VARIABLE_PATTERN.sub(replace_match, template)
-    return result
+    # No value and no default - use empty string
+    logger.debug(
+        "Substituting ${%s%s} with empty string (not found)",
+        f"{namespace}." if namespace else "", var_name
+    )
+    return ""
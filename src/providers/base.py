@@ -9,6 +9,8 @@ from pathlib import Path
 class AIProviderResult:
     """Result from AI provider execution"""
     
+    __slots__ = ("stdout", "stderr", "returncode", "success", "command", "error_message")
+    
     def __init__(
         self,
         stdout: str,
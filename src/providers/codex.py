@@ -1,12 +1,88 @@
 """
 Codex CLI provider implementation
 """
+import codecs
+import io
+import os
+import selectors
+import shlex
 import subprocess
 import shutil
+import sys
+import time
 from pathlib import Path
+from typing import IO
 from src.providers.base import AIProvider, AIProviderResult
 
 
+def _quote_cmd(cmd: list[str]) -> str:
+    """Readable, shell-quoted command string"""
+    return " ".join(map(shlex.quote, cmd))
+
+
+def _to_str(val: str | bytes | None) -> str:
+    """Normalize captured process output (bytes, str or None) to a string"""
+    if isinstance(val, bytes):
+        return val.decode("utf-8", errors="replace")
+    return val or ""
+
+
+def _pump_output(
+    proc: subprocess.Popen,
+    streams: tuple[tuple[IO[bytes], IO[str], list[str]], ...],
+    deadline: float,
+) -> int | None:
+    """
+    Forward a process's pipes to sinks while collecting them, until it exits.
+    
+    Each (pipe, sink, collector) is read without blocking through a single
+    selector and decoded incrementally (UTF-8, universal newlines).
+    
+    Returns:
+        The exit code, or None if the deadline passed (the process is killed)
+    """
+    selector = selectors.DefaultSelector()
+    try:
+        for pipe, sink, collector in streams:
+            os.set_blocking(pipe.fileno(), False)
+            decoder = io.IncrementalNewlineDecoder(
+                codecs.getincrementaldecoder("utf-8")(errors="replace"), translate=True
+            )
+            selector.register(pipe, selectors.EVENT_READ, (sink, collector, decoder))
+        
+        while selector.get_map():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            events = selector.select(min(remaining, 0.5))
+            if not events and proc.poll() is not None:
+                # Exited, but a grandchild may still hold the pipes open
+                break
+            for key, _ in events:
+                sink, collector, decoder = key.data
+                chunk = os.read(key.fd, 65536)
+                if chunk:
+                    text = decoder.decode(chunk)
+                else:
+                    selector.unregister(key.fileobj)
+                    text = decoder.decode(b"", final=True)
+                if text:
+                    sink.write(text)
+                    sink.flush()
+                    collector.append(text)
+        
+        try:
+            return proc.wait(timeout=max(deadline - time.monotonic(), 0))
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+            return None
+    finally:
+        selector.close()
+        for pipe, _, _ in streams:
+            pipe.close()
+
+
 class CodexProvider(AIProvider):
     """Provider for Codex CLI (codex exec)"""
     
@@ -14,9 +90,40 @@ class CodexProvider(AIProvider):
     def name(self) -> str:
         return "codex"
     
+    # How long a successful is_available() answer is reused before PATH is searched again
+    AVAILABLE_TTL = 60.0
+    
+    def __init__(self, workspace_dir: Path, timeout: int = 60):
+        super().__init__(workspace_dir=workspace_dir, timeout=timeout)
+        self._available_checked_at: float | None = None
+    
     def is_available(self) -> bool:
-        """Check if codex CLI is available in PATH"""
-        return shutil.which("codex") is not None
+        """
+        Check if codex CLI is available in PATH.
+        
+        A successful lookup is trusted for AVAILABLE_TTL; a missing CLI is
+        looked up again on the next call, so installing it takes effect at once.
+        """
+        now = time.monotonic()
+        checked_at = self._available_checked_at
+        if checked_at is not None and now - checked_at < self.AVAILABLE_TTL:
+            return True
+        if shutil.which("codex") is not None:
+            self._available_checked_at = now
+            return True
+        self._available_checked_at = None
+        return False
+    
+    @staticmethod
+    def _not_available_result() -> AIProviderResult:
+        return AIProviderResult(
+            stdout="",
+            stderr="Codex CLI not found in PATH",
+            returncode=-1,
+            success=False,
+            command="codex (not available)",
+            error_message="Codex CLI is not installed or not available in PATH"
+        )
     
     def execute(self, prompt: str, model: str | None = None, dry_run: bool = False) -> AIProviderResult:
         """
@@ -31,30 +138,23 @@ class CodexProvider(AIProvider):
             AIProviderResult with execution details
         """
         if not self.is_available():
-            return AIProviderResult(
-                stdout="",
-                stderr="Codex CLI not found in PATH",
-                returncode=-1,
-                success=False,
-                command="codex (not available)",
-                error_message="Codex CLI is not installed or not available in PATH"
-            )
+            return self._not_available_result()
+        
+        # Build command with model parameter
+        cmd = ["codex", "exec", "--sandbox", "workspace-write"]
+        
+        # Add model flag if specified, otherwise use default
+        if model:
+            cmd.extend(["--model", model])
+        else:
+            cmd.extend(["--model", "gpt-5.1-codex-mini"])
+        
+        cmd.append(prompt)
+        
+        # Build readable command string (once, shared by every result below)
+        command_string = _quote_cmd(cmd)
+        
         try:
-            # Build command with model parameter
-            cmd = ["codex", "exec", "--sandbox", "workspace-write"]
-            
-            # Add model flag if specified, otherwise use default
-            if model:
-                cmd.extend(["--model", model])
-            else:
-                cmd.extend(["--model", "gpt-5.1-codex-mini"])
-            
-            cmd.append(prompt)
-            
-            # Build readable command string
-            import shlex
-            command_string = " ".join(shlex.quote(arg) for arg in cmd)
-            
             # If dry-run, return the command string without executing
             if dry_run:
                 return AIProviderResult(
@@ -71,50 +171,24 @@ class CodexProvider(AIProvider):
             print(f"[CodexProvider] Working directory: {self.workspace_dir}")
             print("[CodexProvider] --- Output Start ---")
             
-            # Stream output live while capturing it
-            import sys
-            import threading
-
+            # Stream output live while capturing it: one selector loop pumps both
+            # pipes (no reader threads) and enforces the timeout
             proc = subprocess.Popen(
                 cmd,
                 cwd=str(self.workspace_dir),
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1,  # line-buffered
             )
 
             stdout_lines: list[str] = []
             stderr_lines: list[str] = []
 
-            def _reader(stream, sink, collector):
-                try:
-                    for line in iter(stream.readline, ''):
-                        sink.write(line)
-                        sink.flush()
-                        collector.append(line)
-                finally:
-                    try:
-                        stream.close()
-                    except Exception:
-                        pass
-
-            t_out = threading.Thread(target=_reader, args=(proc.stdout, sys.stdout, stdout_lines))
-            t_err = threading.Thread(target=_reader, args=(proc.stderr, sys.stderr, stderr_lines))
-            t_out.daemon = True
-            t_err.daemon = True
-            t_out.start()
-            t_err.start()
-
-            try:
-                returncode = proc.wait(timeout=self.timeout)
-            except subprocess.TimeoutExpired:
-                # Kill process on timeout
-                proc.kill()
-                try:
-                    proc.communicate(timeout=2)
-                except Exception:
-                    pass
+            returncode = _pump_output(
+                proc,
+                ((proc.stdout, sys.stdout, stdout_lines), (proc.stderr, sys.stderr, stderr_lines)),
+                deadline=time.monotonic() + self.timeout,
+            )
+            if returncode is None:
                 print("[CodexProvider] --- Output End ---")
                 print(f"[CodexProvider] Exit code: 124 (timeout)\n")
                 return AIProviderResult(
@@ -126,10 +200,6 @@ class CodexProvider(AIProvider):
                     error_message=f"Codex execution exceeded timeout of {self.timeout} seconds"
                 )
 
-            # Ensure readers finish
-            t_out.join(timeout=2)
-            t_err.join(timeout=2)
-
             print("[CodexProvider] --- Output End ---")
             print(f"[CodexProvider] Exit code: {returncode}\n")
 
@@ -145,21 +215,6 @@ class CodexProvider(AIProvider):
                 error_message=None if returncode == 0 else "Codex execution failed"
             )
         except subprocess.TimeoutExpired as e:
-            import shlex
-            # Build command string for diagnostics
-            command_string = " ".join(shlex.quote(arg) for arg in cmd) if 'cmd' in locals() else "codex (timeout before command built)"
-
-            # Normalize possible bytes to strings
-            def _to_str(val):
-                if val is None:
-                    return ""
-                if isinstance(val, bytes):
-                    try:
-                        return val.decode("utf-8", errors="replace")
-                    except Exception:
-                        return str(val)
-                return val
-
             out = _to_str(getattr(e, "stdout", ""))
             err = _to_str(getattr(e, "stderr", ""))
             if err:
@@ -175,8 +230,11 @@ class CodexProvider(AIProvider):
                 command=command_string,
                 error_message=f"Codex execution exceeded timeout of {self.timeout} seconds"
             )
+        except FileNotFoundError:
+            # The CLI went away since the last successful lookup: forget it
+            self._available_checked_at = None
+            return self._not_available_result()
         except Exception as e:
-            command_string = "codex (error before execution)"
             return AIProviderResult(
                 stdout="",
                 stderr=str(e),
@@ -22,10 +22,15 @@ class ProviderFactory:
         # "copilot": CopilotProvider,
     }
     
+    # Shared instances: (provider_name, workspace_dir, timeout) -> provider.
+    # Providers keep no per-call state, so one instance can serve every request.
+    _instances: dict[tuple[str, Path, int], AIProvider] = {}
+    _MAX_INSTANCES = 256
+    
     @classmethod
     def create(cls, provider_name: str, workspace_dir: Path, timeout: int = 60) -> AIProvider:
         """
-        Create an AI provider instance
+        Get the AI provider instance for a name, workspace and timeout (created once)
         
         Args:
             provider_name: Name of the provider (e.g., "codex", "claude")
@@ -38,7 +43,12 @@ class ProviderFactory:
         Raises:
             ProviderNotFoundError: If provider is not registered
         """
-        provider_class = cls._providers.get(provider_name.lower())
+        key = (provider_name.lower(), workspace_dir, timeout)
+        provider = cls._instances.get(key)
+        if provider is not None:
+            return provider
+        
+        provider_class = cls._providers.get(key[0])
         
         if provider_class is None:
             available = ", ".join(cls._providers.keys())
@@ -46,7 +56,9 @@ class ProviderFactory:
                 f"Provider '{provider_name}' not found. Available providers: {available}"
             )
         
-        return provider_class(workspace_dir=workspace_dir, timeout=timeout)
+        if len(cls._instances) >= cls._MAX_INSTANCES:
+            cls._instances.clear()
+        return cls._instances.setdefault(key, provider_class(workspace_dir=workspace_dir, timeout=timeout))
     
     @classmethod
     def list_providers(cls) -> list[str]:
@@ -0,0 +1,81 @@
+"""
+Shared pytest fixtures
+"""
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# conftest is imported by every run: the E2E helpers (and httpx) are only
+# imported by the fixtures that need them, so unit-test runs skip them
+
+
+@pytest.fixture(autouse=True)
+def no_prompt_cache(monkeypatch):
+    """Keep load_prompts from writing .prompts-cache.json into fixture directories"""
+    from src.config import Config
+    
+    monkeypatch.setattr(Config, "PROMPT_CACHE_ENABLED", False)
+
+
+@pytest.fixture(autouse=True, scope="session")
+def reap_servers():
+    """At session end, kill any E2E server whose stop() failed or never ran"""
+    yield
+    e2e_utils = sys.modules.get("tests.e2e_utils")
+    if e2e_utils is not None:
+        for server in list(e2e_utils.ServerManager.instances):
+            server.kill()
+
+
+PROJECTS_DIR = Path(__file__).resolve().parent.parent / "data" / "projects"
+
+
+@pytest.fixture(scope="session")
+def e2e_workspace():
+    """
+    Throwaway WORKSPACE_DIR for the E2E server, on tmpfs (/dev/shm) when available.
+    
+    Logs and user storage are written there instead of the repo's data/;
+    projects is a symlink to data/projects, so the real prompts are served.
+    """
+    shm = Path("/dev/shm")
+    workspace = Path(tempfile.mkdtemp(prefix="e2e-", dir=shm if shm.is_dir() else None))
+    try:
+        (workspace / "projects").symlink_to(PROJECTS_DIR, target_is_directory=True)
+        yield workspace
+    finally:
+        shutil.rmtree(workspace, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
+def live_server(e2e_workspace):
+    """
+    One real uvicorn server for the whole E2E session.
+    
+    Each pytest(-xdist) worker gets its own session and an ephemeral port,
+    so workers never share or collide on a server.
+    """
+    from tests.e2e_utils import ServerManager
+    
+    server = ServerManager(env={"WORKSPACE_DIR": str(e2e_workspace), "PROMPT_CACHE_ENABLED": "false"})
+    server.start()
+    try:
+        yield server
+    finally:
+        server.stop()
+
+
+@pytest.fixture(scope="session")
+def e2e_client(live_server):
+    """Keep-alive HTTP client for live_server (one connection pool for the session)"""
+    import httpx
+    
+    with httpx.Client(
+        base_url=live_server.base_url,
+        timeout=5.0,
+        transport=httpx.HTTPTransport(retries=0),
+    ) as client:
+        yield client
@@ -1,67 +1,121 @@
 """
 E2E test utilities for managing real server lifecycle
 """
+import os
+import signal
+import socket
 import subprocess
 import time
+import weakref
 import httpx
 from contextlib import contextmanager
 
 
+def free_port(host="127.0.0.1"):
+    """Return a port that is currently free on host"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind((host, 0))
+        return sock.getsockname()[1]
+
+
 class ServerManager:
     """Manages a real uvicorn server process for E2E testing"""
     
-    def __init__(self, host="127.0.0.1", port=8000, startup_timeout=5):
+    # Every live manager, so session teardown can reap servers a failed stop() left behind
+    instances: "weakref.WeakSet[ServerManager]" = weakref.WeakSet()
+    
+    def __init__(self, host="127.0.0.1", port=0, startup_timeout=5, env=None):
         self.host = host
-        self.port = port
+        # Port 0 picks a free ephemeral port, so servers never collide
+        self.port = port or free_port(host)
         self.startup_timeout = startup_timeout
+        self.env = env  # extra environment variables for the server
         self.process = None
-        self.base_url = f"http://{host}:{port}"
+        self.base_url = f"http://{host}:{self.port}"
+        ServerManager.instances.add(self)
     
     def start(self):
         """Start the server in a subprocess"""
+        # Server output is only captured when debugging (E2E_DEBUG=1); an unread
+        # pipe can fill up and block the server
+        output = subprocess.PIPE if os.environ.get("E2E_DEBUG") == "1" else subprocess.DEVNULL
         self.process = subprocess.Popen(
-            ["uvicorn", "src.main:app", "--host", self.host, "--port", str(self.port)],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
+            [
+                "uvicorn", "src.main:app",
+                "--host", self.host, "--port", str(self.port),
+                "--workers", "1", "--no-access-log",
+            ],
+            stdout=output,
+            stderr=output,
             text=True,
+            close_fds=True,
+            env={**os.environ, **self.env} if self.env else None,
         )
         
-        # Wait for server to be ready
-        start_time = time.time()
-        while time.time() - start_time < self.startup_timeout:
+        # Wait for the port to accept connections (cheap TCP probe), then
+        # confirm with a single HTTP request
+        deadline = time.monotonic() + self.startup_timeout
+        while time.monotonic() < deadline and self.process.poll() is None:
             try:
-                response = httpx.get(f"{self.base_url}/")
-                if response.status_code == 200:
+                socket.create_connection((self.host, self.port), timeout=0.05).close()
+            except OSError:
+                time.sleep(0.02)
+                continue
+            try:
+                if httpx.get(f"{self.base_url}/").status_code == 200:
                     return True
-            except (httpx.ConnectError, httpx.RequestError):
-                time.sleep(0.1)
+            except httpx.RequestError:
+                pass
+            time.sleep(0.02)
         
         # If we get here, server didn't start
         self.stop()
         raise RuntimeError(f"Server failed to start within {self.startup_timeout} seconds")
     
     def stop(self):
-        """Stop the server process"""
+        """Stop the server process (SIGINT for a fast clean shutdown, then SIGKILL)"""
         if self.process:
-            self.process.terminate()
             try:
-                self.process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                self.process.kill()
-                self.process.wait()
+                self.process.send_signal(signal.SIGINT)
+                try:
+                    self.process.wait(timeout=0.5)
+                except subprocess.TimeoutExpired:
+                    self.process.kill()
+                    self.process.wait()
+            except Exception:
+                # Never raise from teardown (it would leave the server running)
+                self.kill()
+            if self.process.poll() is None:
+                # Still alive: keep the handle so the session reaper can retry
+                return "", ""
             
-            # Capture output for debugging
-            stdout, stderr = self.process.communicate() if self.process.poll() is None else ("", "")
+            # Output is only piped when debugging (E2E_DEBUG=1); the process has
+            # exited, so reading the pipes cannot block
+            stdout = self.process.stdout.read() if self.process.stdout else ""
+            stderr = self.process.stderr.read() if self.process.stderr else ""
+            for pipe in (self.process.stdout, self.process.stderr):
+                if pipe:
+                    pipe.close()
             self.process = None
             return stdout, stderr
     
+    def kill(self):
+        """Force-kill the server process if it is still running; never raises"""
+        process = self.process
+        if process is not None and process.poll() is None:
+            try:
+                process.kill()
+                process.wait(timeout=5)
+            except Exception:
+                pass
+    
     def is_running(self):
         """Check if server is running"""
         return self.process is not None and self.process.poll() is None
 
 
 @contextmanager
-def running_server(host="127.0.0.1", port=8000):
+def running_server(host="127.0.0.1", port=0):
     """Context manager for running server during tests"""
     server = ServerManager(host, port)
     try:
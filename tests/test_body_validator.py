@@ -1,6 +1,7 @@
 """
 Unit tests for body validator module
 """
+import json
 import pytest
 from pydantic import ValidationError
 from src.prompts.body_validator import (
@@ -8,6 +9,7 @@ from src.prompts.body_validator import (
     validate_body_schema,
     build_pydantic_model,
     validate_request_body,
+    validate_request_body_json,
     format_validation_errors,
     PromptConfigurationError,
     BodyFieldSchema,
@@ -268,6 +270,16 @@ class TestBuildPydanticModel:
         with pytest.raises(ValidationError):
             model(code="ABCD")
     
+    def test_build_pattern_rejects_trailing_newline(self):
+        """Test that '$' does not accept a trailing newline (no Python re semantics)"""
+        schemas = [BodyFieldSchema(name="code", type="string", required=True, pattern="^[a-z]+$")]
+        validate_body_schema(schemas)
+        model = build_pydantic_model(schemas)
+        
+        model(code="abc")
+        with pytest.raises(ValidationError):
+            model(code="abc\n")
+    
     def test_build_string_with_enum(self):
         """Test string enum validation"""
         schemas = [BodyFieldSchema(
@@ -383,6 +395,26 @@ class TestBuildPydanticModel:
         assert instance.name == "Alice"
         assert instance.age == 30
         assert instance.active is True
+    
+    def test_build_model_cached_per_signature(self):
+        """Test identical schemas reuse one model and different ones don't"""
+        def schemas(enum):
+            return [BodyFieldSchema(name="tone", type="string", enum=enum)]
+        
+        model = build_pydantic_model(schemas(["a", "b"]))
+        assert build_pydantic_model(schemas(["a", "b"])) is model
+        assert build_pydantic_model(schemas(["a", "c"])) is not model
+        
+        with pytest.raises(ValidationError):
+            model(tone="c")
+    
+    def test_build_model_cache_distinguishes_equal_defaults(self):
+        """Test that defaults 1, 1.0 and True (equal in Python) get separate models"""
+        defaults = [
+            build_pydantic_model([BodyFieldSchema(name="n", type="number", default=d)]).model_validate({}).n
+            for d in (1, 1.0, True)
+        ]
+        assert [type(d) for d in defaults] == [int, float, bool]
 
 
 class TestValidateRequestBody:
@@ -414,6 +446,21 @@ class TestValidateRequestBody:
         assert validated["name"] == "Anonymous"
         assert validated["active"] is True
     
+    def test_validate_empty_body_matches_model_defaults(self):
+        """Test that the empty-body fast path returns what Pydantic would"""
+        schemas = [
+            BodyFieldSchema(name="name", type="string", default="Anonymous"),
+            BodyFieldSchema(name="count", type="number", default=3),
+            BodyFieldSchema(name="note", type="string"),
+        ]
+        model = build_pydantic_model(schemas)
+        
+        validated, errors = validate_request_body({}, model)
+        assert errors is None
+        assert validated == model.model_validate({}).__dict__
+        validated["name"] = "changed"
+        assert validate_request_body({}, model)[0]["name"] == "Anonymous"
+    
     def test_validate_missing_required_field(self):
         """Test validation fails for missing required field"""
         schemas = [BodyFieldSchema(name="prompt", type="string", required=True)]
@@ -470,6 +517,30 @@ class TestValidateRequestBody:
         assert validated is None
         assert errors is not None
         assert len(errors) >= 2
+    
+    def test_validate_json_body(self):
+        """Test validation straight from raw JSON bytes"""
+        schemas = [
+            BodyFieldSchema(name="name", type="string", required=True, min_length=3),
+            BodyFieldSchema(name="age", type="number", default=30),
+        ]
+        model = build_pydantic_model(schemas)
+        
+        validated, errors = validate_request_body_json(b'{"name": "Alice", "age": "25"}', model)
+        assert errors is None
+        assert validated == {"name": "Alice", "age": 25.0}
+        
+        validated, errors = validate_request_body_json(b'{"name": "Al"}', model)
+        assert validated is None
+        assert errors[0]["field"] == "body.name"
+        assert errors[0]["received"] == "Al"
+    
+    def test_validate_json_body_invalid_json(self):
+        """Test that malformed JSON raises JSONDecodeError"""
+        model = build_pydantic_model([BodyFieldSchema(name="name", type="string")])
+        
+        with pytest.raises(json.JSONDecodeError):
+            validate_request_body_json(b'{"name": ', model)
 
 
 class TestFormatValidationErrors:
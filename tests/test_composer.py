@@ -0,0 +1,50 @@
+"""
+Unit tests for prompt composition (AGENTS.md merging)
+"""
+import os
+from unittest.mock import patch
+from src.config import Config
+from src.prompts import composer
+from src.prompts.composer import compose_prompt
+
+
+def test_compose_without_agents_file(tmp_path, monkeypatch):
+    """Test that the prompt body is returned as-is when AGENTS.md is missing"""
+    monkeypatch.setattr(Config, "PROJECTS_DIR", tmp_path)
+    (tmp_path / "demo").mkdir()
+    
+    assert compose_prompt("Do it", "demo") == "Do it"
+
+
+def test_compose_with_placeholder_and_concatenation(tmp_path, monkeypatch):
+    """Test placeholder replacement and default concatenation"""
+    monkeypatch.setattr(Config, "PROJECTS_DIR", tmp_path)
+    agents = tmp_path / "demo" / "AGENTS.md"
+    agents.parent.mkdir()
+    
+    agents.write_text("Rules\n{{PROMPT}}\nEnd", encoding="utf-8")
+    assert compose_prompt("Do it", "demo") == "Rules\nDo it\nEnd"
+    
+    agents.write_text("Rules", encoding="utf-8")
+    os.utime(agents, ns=(1, 1))
+    assert compose_prompt("Do it", "demo") == "Rules\n\nDo it"
+
+
+def test_agents_file_cached_until_mtime_changes(tmp_path, monkeypatch):
+    """Test that AGENTS.md is only re-read when its mtime changes"""
+    monkeypatch.setattr(Config, "PROJECTS_DIR", tmp_path)
+    agents = tmp_path / "demo" / "AGENTS.md"
+    agents.parent.mkdir()
+    agents.write_text("v1", encoding="utf-8")
+    
+    assert composer._read_agents_file("demo") == "v1"
+    with patch("builtins.open") as mock_open:
+        assert composer._read_agents_file("demo") == "v1"
+        mock_open.assert_not_called()
+    
+    agents.write_text("v2", encoding="utf-8")
+    os.utime(agents, ns=(1, 1))
+    assert composer._read_agents_file("demo") == "v2"
+    
+    agents.unlink()
+    assert composer._read_agents_file("demo") is None
@@ -3,7 +3,7 @@ Tests for configuration module
 """
 import pytest
 from pathlib import Path
-from src.config import config
+from src.config import Config, config, env
 
 
 def test_get_projects_dir():
@@ -75,3 +75,65 @@ def test_project_exists_case_insensitive():
     """Test project_exists is case-insensitive"""
     assert config.project_exists("TEST") == config.project_exists("test")
     assert config.project_exists("TeSt") == config.project_exists("test")
+
+
+def test_env_snapshot_is_cached_and_frozen():
+    """Test env() reads the environment once and returns an immutable snapshot"""
+    snapshot = env()
+    assert env() is snapshot
+    assert snapshot.logs_dir == config.LOGS_DIR
+    with pytest.raises(AttributeError):
+        snapshot.ai_provider = "other"
+
+
+def test_get_log_file_path_creates_folder_once(tmp_path, monkeypatch):
+    """Test log folders are created on first use and not re-created afterwards"""
+    from datetime import datetime, timezone
+    from unittest.mock import patch
+
+    monkeypatch.setattr(Config, "LOGS_DIR", tmp_path / "logs")
+    ts = datetime(2025, 12, 3, 14, 15, 30, 123456, tzinfo=timezone.utc)
+
+    path = config.get_log_file_path(ts, 200)
+    assert path.parent.is_dir()
+    assert path.parent == tmp_path / "logs" / "2025" / "12" / "03"
+
+    with patch("src.config.os.makedirs") as mock_makedirs:
+        config.get_log_file_path(ts, 404)
+        mock_makedirs.assert_not_called()
+
+
+def test_get_log_file_path_filename_matches_timestamp_format(tmp_path, monkeypatch):
+    """Test log filenames use the same format as format_filename_timestamp"""
+    from datetime import datetime, timezone
+    from src.logging.timestamp import format_filename_timestamp
+
+    monkeypatch.setattr(Config, "LOGS_DIR", tmp_path / "logs")
+    ts = datetime(2025, 1, 2, 3, 4, 5, 6, tzinfo=timezone.utc)
+
+    path = config.get_log_file_path(ts, 500)
+    assert path.name == f"{format_filename_timestamp(ts)}-500.md"
+
+
+def test_list_available_projects_missing_dir(tmp_path, monkeypatch):
+    """Test a missing projects directory yields no projects"""
+    monkeypatch.setattr(Config, "PROJECTS_DIR", tmp_path / "missing")
+    assert config.list_available_projects() == []
+
+
+def test_project_exists_is_cached(tmp_path, monkeypatch):
+    """Test project_exists caches found projects only"""
+    from unittest.mock import patch
+
+    monkeypatch.setattr(Config, "PROJECTS_DIR", tmp_path)
+    (tmp_path / "cached").mkdir()
+    assert config.project_exists("cached") is True
+
+    with patch("pathlib.Path.exists") as mock_exists:
+        assert config.project_exists("CACHED") is True
+        mock_exists.assert_not_called()
+
+    # A missing project is not cached: creating it takes effect at once
+    assert config.project_exists("later") is False
+    (tmp_path / "later").mkdir()
+    assert config.project_exists("later") is True
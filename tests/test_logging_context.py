@@ -41,7 +41,7 @@ def test_request_context_with_custom_request_id():
     assert ctx.request_id == "custom-request-123"
 
 
-@patch('time.time', side_effect=[1000.0, 1001.5])
+@patch('time.monotonic_ns', side_effect=[1_000_000_000_000, 1_001_500_000_000])
 def test_request_context_duration(mock_time):
     """Test duration calculation"""
     ctx = RequestLogContext(
@@ -89,6 +89,40 @@ def test_request_context_set_response():
     assert ctx.status_code == 200
 
 
+def test_request_context_set_response_with_parsed_json():
+    """Test that a parsed JSON payload is carried through to the log entry"""
+    ctx = RequestLogContext("GET", "/test", "default", "anonymous", {})
+    payload = {"error": "Not Found"}
+    ctx.set_response('{"error": "Not Found"}', 404, payload)
+    
+    entry = ctx.to_log_entry()
+    assert entry.response_is_json is True
+    assert entry.response_obj == payload
+    assert entry.response_body == '{"error": "Not Found"}'
+
+
+def test_request_context_set_json_response():
+    """Test that JSON responses are stored as payloads without serializing"""
+    ctx = RequestLogContext("GET", "/test", "default", "anonymous", {})
+    payload = {"error": "Not Found"}
+    ctx.set_json_response(payload, 404)
+    
+    entry = ctx.to_log_entry()
+    assert entry.status_code == 404
+    assert entry.response_is_json is True
+    assert entry.response_obj is payload
+
+
+def test_request_context_set_response_truncates_large_text():
+    """Test that large text bodies are truncated when stored for logging"""
+    ctx = RequestLogContext("GET", "/test", "default", "anonymous", {})
+    ctx.set_response("x" * 20000, 200)
+    
+    entry = ctx.to_log_entry()
+    assert len(entry.response_body) == 10240
+    assert entry.response_full_len == 20000
+
+
 def test_request_context_set_error():
     """Test setting error context"""
     ctx = RequestLogContext("GET", "/test", "default", "anonymous", {})
@@ -115,12 +149,9 @@ def test_request_context_header_filtering():
     
     entry = ctx.to_log_entry()
     
-    assert "X-Project-Id" in entry.headers
-    assert "X-User-Id" in entry.headers
-    assert "X-Dry" in entry.headers
-    assert "Authorization" not in entry.headers
-    assert "User-Agent" not in entry.headers
-    assert "Content-Type" not in entry.headers
+    # Only (X-Project-Id, X-User-Id, X-Dry) survive, in that order
+    assert entry.headers == ("test", "alice", "true")
+    assert "Bearer secret" not in entry.headers
 
 
 def test_request_context_to_log_entry():
@@ -146,3 +177,20 @@ def test_request_context_to_log_entry():
     assert entry.status_code == 200
     assert entry.response_body == "response"
     assert entry.duration_ms >= 0
+
+
+def test_request_context_accepts_headers_mapping():
+    """Test that a Starlette Headers mapping can be passed without copying"""
+    from starlette.datastructures import Headers
+    
+    headers = Headers({"x-project-id": "test", "x-dry": "1", "authorization": "secret"})
+    ctx = RequestLogContext(
+        method="GET",
+        path="/test",
+        project_id="test",
+        user_id="anonymous",
+        headers=headers
+    )
+    
+    assert ctx.headers is headers
+    assert ctx.to_log_entry().headers == ("test", None, "1")
@@ -20,7 +20,7 @@ def test_format_log_markdown_basic_structure():
         prompt_filename="hi.md",
         duration_ms=1000,
         command="codex exec 'prompt'",
-        headers={"X-Project-Id": "default", "X-User-Id": "anonymous"},
+        headers=("default", "anonymous", None),
         ai_output="Hello!",
         response_body="Hello!",
         error_context=None
@@ -68,7 +68,7 @@ def test_format_log_markdown_with_error_context():
         prompt_filename="slow.md",
         duration_ms=5000,
         command="codex exec 'slow command'",
-        headers={},
+        headers=(None, None, None),
         ai_output="Partial output",
         response_body='{"error": "timeout"}',
         error_context="timeout"
@@ -91,7 +91,7 @@ def test_format_log_markdown_no_prompt():
         prompt_filename=None,
         duration_ms=10,
         command="none",
-        headers={},
+        headers=(None, None, None),
         ai_output="",
         response_body='{"error": "Not Found"}',
         error_context=None
@@ -114,11 +114,7 @@ def test_format_log_markdown_headers_filtering():
         prompt_filename="test.md",
         duration_ms=100,
         command="test command",
-        headers={
-            "X-Project-Id": "test",
-            "X-User-Id": "alice",
-            "X-Dry": "true"
-        },
+        headers=("test", "alice", "true"),
         ai_output="output",
         response_body="response",
         error_context=None
@@ -144,10 +140,12 @@ def test_format_log_markdown_json_response():
         prompt_filename="api.md",
         duration_ms=200,
         command="command",
-        headers={},
+        headers=(None, None, None),
         ai_output="output",
         response_body=json.dumps(response_dict),
-        error_context=None
+        error_context=None,
+        response_obj=response_dict,
+        response_is_json=True
     )
     
     markdown = format_log_markdown(entry)
@@ -169,7 +167,7 @@ def test_format_log_markdown_text_response():
         prompt_filename="text.md",
         duration_ms=150,
         command="command",
-        headers={},
+        headers=(None, None, None),
         ai_output="output",
         response_body="Plain text response",
         error_context=None
@@ -193,7 +191,7 @@ def test_format_log_markdown_empty_ai_output():
         prompt_filename=None,
         duration_ms=10,
         command="none",
-        headers={},
+        headers=(None, None, None),
         ai_output="",
         response_body="{}",
         error_context=None
@@ -216,7 +214,7 @@ def test_format_log_markdown_dry_run_omits_sections():
         prompt_filename="hi.md",
         duration_ms=100,
         command="codex exec 'Test prompt'",
-        headers={"X-Dry": "true"},
+        headers=(None, None, "true"),
         ai_output="Not executed (dry-run mode)",
         response_body="Dry-run - no AI execution",
         error_context=None
@@ -236,3 +234,26 @@ def test_format_log_markdown_dry_run_omits_sections():
     assert "## Command" in markdown_dry
     assert "## Headers" in markdown_dry
     assert "| Timestamp  |" in markdown_dry
+
+
+def test_format_log_markdown_text_response_not_reparsed():
+    """Test that text responses are logged verbatim even if they look like JSON"""
+    entry = LogEntry(
+        request_id="20251203-1415-30123456",
+        timestamp=datetime(2025, 12, 3, 14, 15, 30, 123456, tzinfo=timezone.utc),
+        status_code=200,
+        method="GET",
+        path="/text",
+        project_id="default",
+        user_id="anonymous",
+        prompt_filename="text.md",
+        duration_ms=150,
+        command="command",
+        headers=(None, None, None),
+        ai_output="output",
+        response_body='{"compact":true}',
+        error_context=None
+    )
+    
+    markdown = format_log_markdown(entry)
+    assert '```text\n{"compact":true}\n```' in markdown
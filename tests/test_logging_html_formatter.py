@@ -40,3 +40,25 @@ def test_format_log_html_includes_markdown():
     # Markdown should be in the body (escaped)
     assert "My Log" in html
     assert "Status" in html
+
+
+def test_format_log_html_repeated_calls_are_independent():
+    """Test that reusing the shared converter does not leak state between calls"""
+    first = format_log_html("# First\n\nAlpha[^1]\n\n[^1]: note")
+    second = format_log_html("# Second\n\nBeta")
+    
+    assert "First" in first
+    assert "First" not in second
+    assert "note" not in second
+    assert "Beta" in second
+
+
+def test_format_log_html_caches_repeat_renders():
+    """Test that rendering the same markdown twice is served from cache"""
+    from unittest.mock import patch
+    md = "# Cached preview\n\nbody"
+    first = format_log_html(md)
+    with patch("src.logging.html_formatter._MD") as mock_md:
+        second = format_log_html(md)
+        mock_md.reset.assert_not_called()
+    assert second == first
@@ -5,7 +5,7 @@ from unittest.mock import patch, MagicMock, mock_open
 from datetime import datetime, timezone
 from pathlib import Path
 import pytest
-from src.logging.writer import write_log
+from src.logging.writer import write_log, enqueue_log, flush_logs, log_write_failures
 from src.logging.models import LogEntry
 
 
@@ -26,7 +26,7 @@ def test_write_log_success():
             prompt_filename="hi.md",
             duration_ms=1000,
             command="codex exec 'hi'",
-            headers={},
+            headers=(None, None, None),
             ai_output="output",
             response_body="response",
             error_context=None
@@ -35,17 +35,19 @@ def test_write_log_success():
         result = write_log(entry)
         
         assert result == mock_path
-        mock_path.write_text.assert_called_once()
-        # Check that write_text was called with encoding
-        call_args = mock_path.write_text.call_args
-        assert call_args[1]['encoding'] == 'utf-8'
+        mock_path.open.assert_called_once()
+        # Check that the file was opened for binary writing
+        assert mock_path.open.call_args[0][0] == 'wb'
+        handle = mock_path.open.return_value.__enter__.return_value
+        written = b"".join(call[0][0] for call in handle.write.call_args_list)
+        assert written.decode('utf-8').startswith("# 2025/12/03 14:15:30.123456 UTC")
 
 
 def test_write_log_failure():
     """Test log write failure raises IOError"""
     with patch('src.logging.writer.config.get_log_file_path') as mock_get_path:
         mock_path = MagicMock(spec=Path)
-        mock_path.write_text.side_effect = OSError("Disk full")
+        mock_path.open.side_effect = OSError("Disk full")
         mock_get_path.return_value = mock_path
         
         entry = LogEntry(
@@ -59,7 +61,7 @@ def test_write_log_failure():
             prompt_filename="test.md",
             duration_ms=100,
             command="test",
-            headers={},
+            headers=(None, None, None),
             ai_output="",
             response_body="",
             error_context=None
@@ -67,3 +69,87 @@ def test_write_log_failure():
         
         with pytest.raises(IOError, match="Failed to write log file"):
             write_log(entry)
+
+
+def test_write_log_recreates_deleted_folder(tmp_path, monkeypatch):
+    """Test that a log folder deleted between writes (e.g. make clear-logs) is recreated"""
+    import shutil
+    from src.config import Config
+    
+    monkeypatch.setattr(Config, "LOGS_DIR", tmp_path / "logs")
+    entry = LogEntry(
+        request_id="20251203-1415-30123456",
+        timestamp=datetime(2025, 12, 3, 14, 15, 30, 123456, tzinfo=timezone.utc),
+        status_code=200,
+        method="GET",
+        path="/hi",
+        project_id="default",
+        user_id="anonymous",
+        prompt_filename="hi.md",
+        duration_ms=10,
+        command="codex exec 'hi'",
+        headers=(None, None, None),
+        ai_output="output",
+        response_body="response",
+        error_context=None
+    )
+    
+    first = write_log(entry, "first")
+    shutil.rmtree(tmp_path / "logs")
+    second = write_log(entry, "second")
+    
+    assert not first.exists()
+    assert second.read_text(encoding='utf-8').startswith("# 2025/12/03 14:15:30.123456 UTC")
+
+
+def test_enqueue_log_writes_in_background(tmp_path):
+    """Test that queued entries are written by the background writer"""
+    log_path = tmp_path / "queued-200.md"
+    with patch('src.logging.writer.config.get_log_file_path', return_value=log_path):
+        entry = LogEntry(
+            request_id="20251203-1415-30123456",
+            timestamp=datetime(2025, 12, 3, 14, 15, 30, 123456, tzinfo=timezone.utc),
+            status_code=200,
+            method="GET",
+            path="/hi",
+            project_id="default",
+            user_id="anonymous",
+            prompt_filename="hi.md",
+            duration_ms=10,
+            command="codex exec 'hi'",
+            headers=(None, None, None),
+            ai_output="output",
+            response_body="response",
+            error_context=None
+        )
+        
+        enqueue_log(entry)
+        flush_logs()
+    
+    assert log_path.read_text(encoding='utf-8').startswith("# 2025/12/03 14:15:30.123456 UTC")
+
+
+def test_background_write_failures_are_counted():
+    """Test that failed background writes are counted instead of lost silently"""
+    entry = LogEntry(
+        request_id="20251203-1415-30123456",
+        timestamp=datetime(2025, 12, 3, 14, 15, 30, 123456, tzinfo=timezone.utc),
+        status_code=200,
+        method="GET",
+        path="/hi",
+        project_id="default",
+        user_id="anonymous",
+        prompt_filename="hi.md",
+        duration_ms=10,
+        command="codex exec 'hi'",
+        headers=(None, None, None),
+        ai_output="output",
+        response_body="response",
+        error_context=None
+    )
+    before = log_write_failures()
+    with patch('src.logging.writer.write_log', side_effect=IOError("Disk full")):
+        enqueue_log(entry)
+        flush_logs()
+    
+    assert log_write_failures() == before + 1
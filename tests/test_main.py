@@ -1,6 +1,8 @@
 """
 Tests for main API endpoints
 """
+import json
+import pytest
 from fastapi.testclient import TestClient
 from src.main import app
 from unittest.mock import patch
@@ -887,3 +889,90 @@ def test_request_id_in_error_response():
                         assert len(request_id) == 22
 
 
+
+
+def test_get_router_reuses_until_prompts_change(tmp_path):
+    """Test that routers are cached per prompts dir and reloaded on change"""
+    import os
+    from src.main import get_router
+    
+    prompt_file = tmp_path / "hello.md"
+    prompt_file.write_text("Hello")
+    
+    router = get_router(tmp_path)
+    assert [p.filename for p in router.prompts] == ["hello"]
+    assert get_router(tmp_path) is router
+    
+    # Editing a prompt invalidates the cached router
+    prompt_file.write_text("Hello again")
+    os.utime(prompt_file, ns=(0, 0))
+    reloaded = get_router(tmp_path)
+    assert reloaded is not router
+    assert reloaded.prompts[0].get_body() == "Hello again"
+    
+    # Adding a prompt invalidates it too
+    (tmp_path / "bye.md").write_text("Bye")
+    assert [p.filename for p in get_router(tmp_path).prompts] == ["bye", "hello"]
+
+
+def test_setup_user_workspace_creates_dirs_once(tmp_path, monkeypatch):
+    """Test that workspace directories are created once and then remembered"""
+    from src.config import Config
+    from src.main import setup_user_workspace
+    
+    monkeypatch.setattr(Config, "STORAGE_DIR", tmp_path)
+    workspace = setup_user_workspace("alice", "once")
+    assert workspace.is_dir()
+    
+    with patch("pathlib.Path.mkdir") as mock_mkdir:
+        assert setup_user_workspace("alice", "once") == workspace
+        mock_mkdir.assert_not_called()
+
+
+def test_json_ai_output_logged_as_json():
+    """Test that JSON AI output is logged from the parsed payload (pretty-printed, not truncated)"""
+    payload = {"items": ["x" * 100] * 200}
+    mock_result = AIProviderResult(
+        stdout=json.dumps(payload),
+        stderr="",
+        returncode=0,
+        success=True,
+        error_message=None,
+        command="test command"
+    )
+    mock_prompt = PromptMetadata(
+        filename="test",
+        filepath=Path("/tmp/test.md"),
+        method="GET",
+        route=None,
+        model=None,
+        agent=None,
+        raw_content="Test prompt"
+    )
+    mock_match = RouteMatch(prompt=mock_prompt, match_type="fallback", path_params={})
+    
+    with patch("src.config.config.project_exists", return_value=True), \
+         patch("src.config.config.get_project_prompts_dir", return_value=Path("/tmp/test/prompts")), \
+         patch("src.main.setup_user_workspace", return_value=Path("/tmp/workspace")), \
+         patch("src.prompts.router.DynamicRouter.load_prompts"), \
+         patch("src.prompts.router.DynamicRouter.match_route", return_value=mock_match), \
+         patch("src.providers.codex.CodexProvider.is_available", return_value=True), \
+         patch("src.prompts.executor.PromptExecutor.execute", return_value=mock_result), \
+         patch("src.main.enqueue_log") as mock_enqueue:
+        response = client.get("/test", headers=TEST_HEADERS)
+    
+    assert response.status_code == 200
+    entry = mock_enqueue.call_args[0][0]
+    assert entry.response_is_json
+    assert entry.response_obj == payload
+    assert entry.response_full_len is None
+
+
+def test_lifespan_starts_and_flushes_log_writer():
+    """Test that the app starts the log writer and drains it on shutdown"""
+    with patch("src.main.start_log_writer") as mock_start:
+        with patch("src.main.flush_logs") as mock_flush:
+            with TestClient(app):
+                mock_start.assert_called_once()
+                mock_flush.assert_not_called()
+            mock_flush.assert_called_once()
@@ -1,7 +1,7 @@
 import json
 from pathlib import Path
 
-from src.openapi.generator import generate_openapi
+from src.openapi.generator import generate_openapi, generate_openapi_bytes
 from src.config import config
 
 
@@ -37,4 +37,74 @@ Hello B
 
     result = generate_openapi(pdir)
     assert "errors" in result
-    assert any(e["type"] == "route_conflict" for e in result["errors"])
\ No newline at end of file
+    assert any(e["type"] == "route_conflict" for e in result["errors"])
+
+def test_generate_openapi_cached_until_prompts_change(tmp_path: Path):
+    pdir = tmp_path / "prompts"
+    pdir.mkdir(parents=True, exist_ok=True)
+    (pdir / "hello.md").write_text("Hello", encoding="utf-8")
+
+    doc = generate_openapi(pdir)
+    assert generate_openapi(pdir) is doc
+    assert list(doc["paths"]) == ["/hello"]
+
+    (pdir / "bye.md").write_text("Bye", encoding="utf-8")
+    refreshed = generate_openapi(pdir)
+    assert refreshed is not doc
+    assert sorted(refreshed["paths"]) == ["/bye", "/hello"]
+
+
+def test_generate_openapi_bytes_cached_with_document(tmp_path: Path):
+    pdir = tmp_path / "prompts"
+    pdir.mkdir(parents=True, exist_ok=True)
+    (pdir / "a.md").write_text("Hello", encoding="utf-8")
+
+    doc, body = generate_openapi_bytes(pdir)
+    assert doc is generate_openapi(pdir)
+    assert json.loads(body) == doc
+    assert generate_openapi_bytes(pdir)[1] is body
+
+    (pdir / "b.md").write_text("World", encoding="utf-8")
+    _, body2 = generate_openapi_bytes(pdir)
+    assert "/b" in json.loads(body2)["paths"]
+
+
+def test_generate_openapi_explicit_fallback_collision(tmp_path: Path):
+    # Explicit GET /b collides with the fallback route of b.md, in either file order
+    for explicit_name, fallback_name in (("a", "b"), ("c", "b")):
+        pdir = tmp_path / f"prompts-{explicit_name}"
+        pdir.mkdir(parents=True, exist_ok=True)
+        (pdir / f"{explicit_name}.md").write_text("""---
+route: /b
+method: GET
+---
+Explicit
+""", encoding="utf-8")
+        (pdir / f"{fallback_name}.md").write_text("Fallback", encoding="utf-8")
+
+        result = generate_openapi(pdir)
+        assert result["errors"] == [{
+            "file": str(pdir / f"{explicit_name}.md"),
+            "type": "route_conflict",
+            "message": "Explicit GET /b collides with fallback GET /b",
+        }]
+
+
+def test_generate_openapi_param_name_conflict(tmp_path: Path):
+    # Routes differing only in parameter names match the same requests
+    pdir = tmp_path / "prompts"
+    pdir.mkdir(parents=True, exist_ok=True)
+    for name, route in (("a", "/users/{id}"), ("b", "/users/{name}"), ("c", "/users/{rest:path}")):
+        (pdir / f"{name}.md").write_text(f"""---
+route: {route}
+method: GET
+---
+Body
+""", encoding="utf-8")
+
+    result = generate_openapi(pdir)
+    assert result["errors"] == [{
+        "file": str(pdir / "b.md"),
+        "type": "route_conflict",
+        "message": "Explicit route GET /users/{name} also defined by a",
+    }]
@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 from src.openapi.generator import generate_openapi
 
@@ -13,3 +14,32 @@ def test_request_body_schema_included_for_post_routes():
     # Body schema support is tested in test_body_validator.py
     assert "operationId" in op
     assert "parameters" in op
+
+
+def test_request_body_memoized_until_prompt_changes(tmp_path: Path):
+    pdir = tmp_path / "prompts"
+    pdir.mkdir()
+    prompt = pdir / "create.md"
+    prompt.write_text("""---
+route: /items
+method: POST
+body:
+  name:
+    type: string
+    required: true
+---
+Create ${body.name}
+""", encoding="utf-8")
+    (pdir / "other.md").write_text("Other", encoding="utf-8")
+
+    body = generate_openapi(pdir)["paths"]["/items"]["post"]["requestBody"]
+    assert body["content"]["application/json"]["schema"]["required"] == ["name"]
+
+    # Another file changing rebuilds the document but reuses the requestBody
+    (pdir / "other.md").write_text("Other, edited", encoding="utf-8")
+    assert generate_openapi(pdir)["paths"]["/items"]["post"]["requestBody"] is body
+
+    prompt.write_text(prompt.read_text(encoding="utf-8").replace("required: true", "required: false"), encoding="utf-8")
+    os.utime(prompt, ns=(1, 1))
+    schema = generate_openapi(pdir)["paths"]["/items"]["post"]["requestBody"]["content"]["application/json"]["schema"]
+    assert "required" not in schema
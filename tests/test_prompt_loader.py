@@ -1,8 +1,11 @@
 """
 Unit tests for prompt loader module
 """
+import os
+import sys
 import pytest
 from pathlib import Path
+from unittest.mock import patch
 from src.prompts.loader import load_prompts, PromptMetadata
 
 
@@ -23,7 +26,7 @@ def test_load_valid_prompts():
     assert greet.method == "GET"
     assert greet.model == "gpt-5.1-codex-mini"
     assert greet.agent is None
-    assert "${name}" in greet.raw_content
+    assert "${name}" in greet.get_body()
 
 
 def test_load_minimal_prompt():
@@ -36,7 +39,7 @@ def test_load_minimal_prompt():
     assert minimal.route is None  # no explicit route
     assert minimal.model is None
     assert minimal.agent is None
-    assert "minimal prompt" in minimal.raw_content
+    assert "minimal prompt" in minimal.get_body()
 
 
 def test_load_prompt_with_multiple_params():
@@ -47,8 +50,8 @@ def test_load_prompt_with_multiple_params():
     assert api is not None
     assert api.route == "/api/{version}/user/{id}"
     assert api.method == "POST"
-    assert "${version}" in api.raw_content
-    assert "${id}" in api.raw_content
+    assert "${version}" in api.get_body()
+    assert "${id}" in api.get_body()
 
 
 def test_load_invalid_yaml_graceful():
@@ -89,3 +92,90 @@ def test_filename_extraction():
     for prompt in prompts:
         assert not prompt.filename.endswith(".md")
         assert prompt.filepath.suffix == ".md"
+
+
+def test_load_prompts_uses_cache_until_files_change(tmp_path):
+    """Test that parsed prompts are served from .prompts-cache.json while files are unchanged"""
+    (tmp_path / "hello.md").write_text("---\nroute: /hi\nbody:\n  name:\n    type: string\n---\nHi", encoding="utf-8")
+    first = load_prompts(tmp_path, use_cache=True)
+    assert (tmp_path / ".prompts-cache.json").exists()
+    
+    with patch("src.prompts.loader._parse_prompt_file") as mock_parse:
+        cached = load_prompts(tmp_path, use_cache=True)
+        mock_parse.assert_not_called()
+    assert cached == first
+    
+    (tmp_path / "hello.md").write_text("---\nroute: /hello\n---\nHello", encoding="utf-8")
+    os.utime(tmp_path / "hello.md", ns=(1, 1))
+    assert load_prompts(tmp_path, use_cache=True)[0].route == "/hello"
+
+
+def test_load_prompts_without_cache(tmp_path):
+    """Test that use_cache=False neither reads nor writes the cache file"""
+    (tmp_path / "hello.md").write_text("Hi", encoding="utf-8")
+    assert [p.filename for p in load_prompts(tmp_path, use_cache=False)] == ["hello"]
+    assert not (tmp_path / ".prompts-cache.json").exists()
+
+
+def test_load_prompts_cache_write_failure_not_retried(tmp_path, caplog):
+    """Test that a failed cache write is logged once and not attempted again"""
+    (tmp_path / "hello.md").write_text("Hi", encoding="utf-8")
+    with patch("src.prompts.loader.open", side_effect=PermissionError("read-only"), create=True) as mock_open:
+        with caplog.at_level("WARNING", logger="src.prompts.loader"):
+            load_prompts(tmp_path, use_cache=True)
+            load_prompts(tmp_path, use_cache=True)
+    writes = [c for c in mock_open.call_args_list if c.args[1] == 'w']
+    assert len(writes) == 1
+    assert len([r for r in caplog.records if "prompt cache" in r.message]) == 1
+
+
+def test_body_may_contain_frontmatter_delimiters(tmp_path):
+    """Test that only the first --- pair delimits frontmatter"""
+    (tmp_path / "doc.md").write_text("---\nroute: /doc\n---\nIntro\n---\nMore", encoding="utf-8")
+    prompt = load_prompts(tmp_path, use_cache=False)[0]
+    assert prompt.route == "/doc"
+    assert prompt.get_body() == "Intro\n---\nMore"
+
+
+def test_prompt_body_loaded_lazily(tmp_path):
+    """Test that only frontmatter is read at load time and the body on first use"""
+    (tmp_path / "lazy.md").write_bytes(b"---\r\nroute: /lazy\r\n---\r\nLine 1\r\nLine 2\r\n")
+    prompt = load_prompts(tmp_path, use_cache=False)[0]
+    
+    assert prompt.route == "/lazy"
+    assert prompt.raw_content is None
+    assert prompt.get_body() == "Line 1\nLine 2"
+    assert prompt.raw_content == "Line 1\nLine 2"
+
+
+def test_load_many_prompts_keeps_file_order(tmp_path):
+    """Test that large directories (loaded concurrently) keep sorted file order"""
+    for i in range(40):
+        (tmp_path / f"p{i:02d}.md").write_text(f"---\nroute: /p/{i}\n---\nBody {i}", encoding="utf-8")
+    (tmp_path / "p99.md").write_text("---\ninvalid yaml here: [\n---\nBroken", encoding="utf-8")
+    
+    prompts = load_prompts(tmp_path, use_cache=False)
+    assert [p.filename for p in prompts] == [f"p{i:02d}" for i in range(40)]
+    assert prompts[7].get_body() == "Body 7"
+
+
+def test_prompt_metadata_interns_short_strings(tmp_path):
+    """Test that method, agent and filename are interned when loaded"""
+    (tmp_path / "hello.md").write_text("---\nmethod: post\nagent: codex\n---\nHi", encoding="utf-8")
+    
+    prompt = load_prompts(tmp_path, use_cache=False)[0]
+    assert prompt.method is sys.intern("POST")
+    assert prompt.agent is sys.intern("codex")
+    assert prompt.filename is sys.intern("hello")
+
+
+def test_frontmatter_values_coerced(tmp_path):
+    """Test that non-string frontmatter values are normalized"""
+    (tmp_path / "a.md").write_text("---\nmethod: post\nroute: 42\nmodel: 5\ndry: 'Yes'\nbody: [1]\n---\nA", encoding="utf-8")
+    (tmp_path / "b.md").write_text("---\ndry: 0\n---\nB", encoding="utf-8")
+    (tmp_path / "c.md").write_text("---\ndry: false\n---\nC", encoding="utf-8")
+    
+    a, b, c = load_prompts(tmp_path, use_cache=False)
+    assert (a.method, a.route, a.model, a.agent, a.dry, a.body_schema) == ("POST", "42", "5", None, True, None)
+    assert (b.method, b.dry) == ("GET", False)
+    assert c.dry is False
@@ -1,6 +1,7 @@
 """
 Tests for AI providers
 """
+import os
 import pytest
 from pathlib import Path
 from src.providers.base import AIProvider, AIProviderResult
@@ -81,6 +82,46 @@ class TestCodexProvider:
         assert result.success is False
         assert result.returncode == -1
         assert "not found" in result.stderr.lower()
+    
+    def test_availability_cached_per_instance(self, tmp_path, monkeypatch):
+        """Test that the PATH lookup is reused until the TTL expires"""
+        import shutil
+        calls = []
+        monkeypatch.setattr(shutil, "which", lambda name: calls.append(name) or "/usr/bin/codex")
+        
+        provider = CodexProvider(workspace_dir=tmp_path)
+        assert provider.is_available() is True
+        assert provider.is_available() is True
+        assert len(calls) == 1
+        
+        provider._available_checked_at -= CodexProvider.AVAILABLE_TTL
+        assert provider.is_available() is True
+        assert len(calls) == 2
+        
+        # A missing CLI is never cached
+        monkeypatch.setattr(shutil, "which", lambda name: calls.append(name) and None)
+        provider._available_checked_at -= CodexProvider.AVAILABLE_TTL
+        assert provider.is_available() is False
+        assert provider.is_available() is False
+        assert len(calls) == 4
+    
+    def test_missing_binary_on_execute_invalidates_cache(self, tmp_path, monkeypatch):
+        """Test that a CLI removed after a cached lookup is looked up again"""
+        import shutil
+        import subprocess
+        monkeypatch.setattr(shutil, "which", lambda name: "/usr/bin/codex")
+        
+        def missing(*args, **kwargs):
+            raise FileNotFoundError("codex")
+        
+        monkeypatch.setattr(subprocess, "Popen", missing)
+        provider = CodexProvider(workspace_dir=tmp_path)
+        result = provider.execute("test prompt")
+        
+        assert result.success is False
+        assert result.returncode == -1
+        assert "not found" in result.stderr.lower()
+        assert provider._available_checked_at is None
 
 
 class TestProviderFactory:
@@ -106,6 +147,12 @@ class TestProviderFactory:
         assert isinstance(providers, list)
         assert "codex" in providers
     
+    def test_create_returns_shared_instance(self, tmp_path):
+        """Test that the same name/workspace/timeout yields one shared provider"""
+        provider = ProviderFactory.create("codex", workspace_dir=tmp_path, timeout=30)
+        assert ProviderFactory.create("Codex", workspace_dir=tmp_path, timeout=30) is provider
+        assert ProviderFactory.create("codex", workspace_dir=tmp_path, timeout=31) is not provider
+    
     def test_create_with_custom_timeout(self, tmp_path):
         """Test creating provider with custom timeout"""
         provider = ProviderFactory.create("codex", workspace_dir=tmp_path, timeout=120)
@@ -154,3 +201,37 @@ class TestCodexProviderDryRun:
         assert result.stderr == ""
         assert result.error_message is None
 
+
+
+class TestCodexProviderExecution:
+    """Tests for CodexProvider output streaming (fake codex on PATH)"""
+    
+    @staticmethod
+    def _fake_codex(tmp_path, monkeypatch, script):
+        bin_dir = tmp_path / "bin"
+        bin_dir.mkdir()
+        codex = bin_dir / "codex"
+        codex.write_text(f"#!/bin/sh\n{script}\n", encoding="utf-8")
+        codex.chmod(0o755)
+        monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}")
+    
+    def test_execute_collects_stdout_and_stderr(self, tmp_path, monkeypatch):
+        """Both pipes are captured, decoded and newline-normalized"""
+        self._fake_codex(tmp_path, monkeypatch, "printf 'out 1\\r\\nout 2\\n'; echo 'err 1' >&2; exit 3")
+        provider = CodexProvider(workspace_dir=tmp_path, timeout=10)
+        result = provider.execute("Test prompt")
+        
+        assert result.stdout == "out 1\nout 2\n"
+        assert result.stderr == "err 1\n"
+        assert result.returncode == 3
+        assert result.success is False
+    
+    def test_execute_timeout_kills_process(self, tmp_path, monkeypatch):
+        """A process running past the timeout is killed and reported as 124"""
+        self._fake_codex(tmp_path, monkeypatch, "echo started; exec sleep 30")
+        provider = CodexProvider(workspace_dir=tmp_path, timeout=1)
+        result = provider.execute("Test prompt")
+        
+        assert result.returncode == 124
+        assert result.stdout == "started\n"
+        assert result.stderr.endswith("[ERROR] Codex execution timed out")
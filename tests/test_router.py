@@ -124,3 +124,67 @@ def test_load_empty_prompts():
     
     match = router.match_route("GET", "/anything")
     assert match is None
+
+
+def test_invalid_route_pattern_skipped(tmp_path):
+    """Test that a route that is not a valid pattern is skipped at load time"""
+    (tmp_path / "bad.md").write_text("---\nroute: /bad/(\n---\nBad", encoding="utf-8")
+    (tmp_path / "good.md").write_text("---\nroute: /good/{id}\n---\nGood", encoding="utf-8")
+    router = DynamicRouter(tmp_path)
+    router.load_prompts()
+    
+    assert [p.filename for p, _ in router._explicit] == ["good"]
+    assert router.match_route("GET", "/bad/(") is None
+    assert router.match_route("GET", "/good/7").path_params == {"id": "7"}
+
+
+def test_combined_routes_priority_and_params(tmp_path):
+    """Test that one combined pattern per method keeps file order and per-route params"""
+    routes = {
+        "a": ("GET", "/items/{id}/detail"),
+        "b": ("GET", "/items/{name}"),
+        "c": ("GET", "/items/{rest:path}"),
+        "d": ("POST", "/items/{id}"),
+    }
+    for name, (method, route) in routes.items():
+        (tmp_path / f"{name}.md").write_text(f"---\nmethod: {method}\nroute: {route}\n---\n{name}", encoding="utf-8")
+    router = DynamicRouter(tmp_path)
+    router.load_prompts()
+    
+    match = router.match_route("GET", "/items/7/detail")
+    assert (match.prompt.filename, match.path_params) == ("a", {"id": "7"})
+    match = router.match_route("GET", "/items/7")
+    assert (match.prompt.filename, match.path_params) == ("b", {"name": "7"})
+    match = router.match_route("GET", "/items/7/other")
+    assert (match.prompt.filename, match.path_params) == ("c", {"rest": "7/other"})
+    match = router.match_route("POST", "/items/7")
+    assert (match.prompt.filename, match.path_params) == ("d", {"id": "7"})
+    assert router.match_route("PUT", "/items/7") is None
+
+
+def test_static_routes_fast_path_keeps_priority(tmp_path):
+    """Test that static routes use the dict lookup unless an earlier route shadows them"""
+    routes = {
+        "a_static": "/health",
+        "b_dynamic": "/users/{id}",
+        "c_shadowed": "/users/me",
+    }
+    for name, route in routes.items():
+        (tmp_path / f"{name}.md").write_text(f"---\nroute: {route}\n---\n{name}", encoding="utf-8")
+    router = DynamicRouter(tmp_path)
+    router.load_prompts()
+    
+    assert set(router._static) == {("GET", "/health")}
+    assert router.match_route("GET", "/health").prompt.filename == "a_static"
+    match = router.match_route("GET", "/users/me")
+    assert (match.prompt.filename, match.path_params) == ("b_dynamic", {"id": "me"})
+
+
+def test_route_must_match_whole_path(tmp_path):
+    """Test that explicit routes match the entire path (no trailing newline slack)"""
+    (tmp_path / "health.md").write_text("---\nroute: /health\n---\nOK", encoding="utf-8")
+    router = DynamicRouter(tmp_path)
+    router.load_prompts()
+    
+    assert router.match_route("GET", "/health") is not None
+    assert router._match_explicit("GET", "/health\n") is None
@@ -151,3 +151,27 @@ def test_all_namespaces_with_defaults():
     )
     assert result == "User Alice wants to code with tone casual"
 
+
+
+def test_substitute_body_none_value_is_empty():
+    """Test that None body values substitute as empty strings"""
+    template = "Tone: [${body.tone}]"
+    result = substitute_variables(template, body_params={"tone": None})
+    assert result == "Tone: []"
+
+
+def test_template_tokenized_once():
+    """Test that a template is scanned once and reused with different params"""
+    from src.prompts.variables import _tokenize
+    
+    template = "Hi ${route.name}, ${body.task:rest} ${unused}"
+    _tokenize.cache_clear()
+    assert substitute_variables(template, route_params={"name": "A"}) == "Hi A, rest "
+    assert substitute_variables(template, route_params={"name": "B"}, body_params={"task": "code"}) == "Hi B, code "
+    assert _tokenize.cache_info().misses == 1
+
+
+def test_template_without_placeholders_returned_as_is():
+    """Test that templates without ${ skip substitution entirely"""
+    template = "Plain prompt with $dollar and {braces}"
+    assert substitute_variables(template, route_params={"dollar": "x"}) is template